@@ -1,25 +1,56 @@
 import argparse
+import signal
 import time
+from typing import Any
 
 from loguru import logger
-from PIL import Image
 
 from app_manager import AppManager
+from bench import Benchmark
 from board import Board
 from config import Configuration
-from custom_frames import CustomFrames
-from enums.encoder_input import EncoderInput
+from display import Display
+from enums.matrix_backend import MatrixBackend
+from frame_stats import FrameStats
 from logs import Logs
-from models.application import Application
 from path import PathTo
+from renderer import Renderer
+from scheduler import FrameScheduler
+from splash import Splash
+from standby import Standby
 from webserver import WebServer
 
 
+def stop_on_signal(signum: int, _frame: Any) -> None:
+    """
+    Stops the main loop through the same shutdown path as Ctrl+C, for the SIGTERM sent by docker or systemd.
+
+    :param signum: The number of the signal received.
+    """
+    logger.info(f"[Main] Received {signal.Signals(signum).name}, stopping.")
+    raise KeyboardInterrupt
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Carousel LED matrix controller")
     parser.add_argument("--debug", action="store_true", help="Run with debug console")
     parser.add_argument("--emulator", action="store_true", help="Run in emulator mode")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record every presented frame to the recording file",
+    )
+    parser.add_argument(
+        "--bench",
+        type=int,
+        nargs="?",
+        const=Benchmark.DEFAULT_FRAMES,
+        metavar="FRAMES",
+        help="Benchmark the enabled apps headlessly, rendering FRAMES frames each",
+    )
     args = parser.parse_args()
+    if args.bench is not None and args.bench < 1:
+        parser.error("argument --bench: FRAMES must be a positive number")
 
     PathTo.set_base_directory()
     PathTo.add_library_to_path()
@@ -31,49 +62,90 @@ def main() -> None:
 
     Configuration.load()
 
-    Board.init_system(use_emulator=args.emulator)
+    if args.bench is not None:
+        Board.init_system(matrix_backend=MatrixBackend.NULL, use_mock_gpio=True)
+        AppManager.init_apps()
+        Benchmark.run(args.bench)
+        AppManager.stop_apps()
+        return
 
-    AppManager.init_apps()
+    Board.init_system(
+        matrix_backend=(
+            MatrixBackend.EMULATOR if args.emulator else MatrixBackend.HARDWARE
+        ),
+        record=args.record,
+    )
+
+    Splash.start()
+    AppManager.init_apps(on_progress=Splash.report_progress)
+    Splash.stop()
 
     # TODO: remove this when webserver is implemented with new config and workflow
     # server = WebServer()
     # TODO: port should be configurable
     # server.start(port=9000, debug=args.debug)
 
-    # TODO: change back to > 0 when implemented
-    Board.loading_animation(duration_in_seconds=0)
+    Renderer.init()
+    FrameScheduler.init(Board.refresh_rate)
+    # The summary is logged by the loop, on the next frame or input
+    signal.signal(signal.SIGUSR1, lambda *_: FrameStats.request_summary())
+    # Without it, the statistics would not be dumped nor the shared memory of the workers released
+    signal.signal(signal.SIGTERM, stop_on_signal)
 
     while True:
         try:
+            FrameStats.log_requested_summary()
             # TODO: remove this check when webserver is implemented with new config and workflow
             if False:
                 # if server.is_user_connected():
-                Board.matrix.SetImage(CustomFrames.black())
+                has_changed = Display.clear()
+                app_name = None
+                valid_until = None
             else:
-                if not Board.encoder_queue.empty():
-                    Board.encoder_state += Board.encoder_queue.get()
-
-                if Board.has_encoder_increased():
-                    Board.encoder_input = EncoderInput.INCREASE_CLOCKWISE
-                    Board.reset_encoder_state()
-                elif Board.has_encoder_decreased():
-                    Board.encoder_input = EncoderInput.DECREASE_COUNTERCLOCKWISE
-                    Board.reset_encoder_state()
-
-                current_app: Application = AppManager.get_current_app()
-                frame: Image = current_app.generate(
-                    Board.tilt_state, Board.encoder_input
+                if not Board.is_display_on:
+                    Standby.run()
+                    continue
+
+                if FrameScheduler.is_idle():
+                    Renderer.invalidate()
+                    FrameStats.reset_tick()
+                # A wait cut by an input or without expiry is a pause, one run to the expiry is the frame interval
+                elif FrameScheduler.interrupted_expiry_wait:
+                    FrameStats.reset_tick()
+
+                frame, app_name, valid_until = Renderer.next_frame()
+                # The app turned the display off while rendering this frame
+                if not Board.is_display_on:
+                    continue
+                start_time = time.perf_counter()
+                has_changed = Display.present(frame)
+                FrameStats.record(
+                    app_name, FrameStats.PRESENT, time.perf_counter() - start_time
                 )
-                Board.matrix.SetImage(
-                    frame if Board.is_display_on else CustomFrames.black()
+                FrameStats.tick(app_name)
+
+            # The loop is idle while the content is static or the frame on screen stays valid
+            if FrameScheduler.is_idle() or (
+                valid_until is not None
+                and valid_until - time.monotonic() > Board.refresh_rate
+            ):
+                Renderer.prewarm()
+
+            # The inputs left for the next frames keep the loop from backing off
+            if (
+                FrameScheduler.wait_for_next_frame(
+                    has_changed or Board.has_pending_events(), valid_until
                 )
-
-                Board.reset_encoder_input_status()
-
-            time.sleep(Board.refresh_rate)
+                and app_name
+            ):
+                FrameStats.record_missed_deadline(app_name)
         except KeyboardInterrupt:
-            logger.info("[Main] Program stopped by user.")
-            Board.matrix.SetImage(CustomFrames.black())
+            logger.info("[Main] Program stopped.")
+            FrameScheduler.log_statistics()
+            FrameStats.log_summary()
+            FrameStats.dump()
+            Display.clear()
+            AppManager.stop_apps()
             break
 
 
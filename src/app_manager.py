@@ -1,12 +1,20 @@
 import sys
-from typing import Callable, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 
-from apps import gif_viewer, main_screen, pomodoro
 from board import Board
+from color_correction import ColorCorrection
+from config import Configuration
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
 from models.application import Application
+from models.lazy_application import LazyApplication
 from models.module import Module
+from models.process_application import ProcessApplication
+from registry import Registry
 
 
 class AppManager:
@@ -14,23 +22,70 @@ class AppManager:
     Manages the current application and provides methods to switch between applications.
     """
 
+    BOOT_WORKERS: int = 4
+    EVICTION_CHECK_PERIOD: float = 1.0
+
     current_app_index: int = 0
     modules: Dict[str, Module]
     apps: List[Application]
     enabled_apps: List[Application]
     carousel: List[Application]
+    # App shown for each slot of the carousel and tilt state
+    routes: Dict[Tuple[int, TiltState], Application] = {}
+    shown_app: Optional[Application] = None
+    evictable_apps: List[LazyApplication] = []
+    last_eviction_check: float = 0
+    # Whether the neighbours of the app shown are kept, as they are prewarmed
+    keep_neighbour_apps: bool = False
 
     @classmethod
-    def init_apps(cls) -> None:
+    def init_apps(
+        cls, on_progress: Optional[Callable[[str, int, int], None]] = None
+    ) -> None:
         """
-        Initialize the applications.
+        Initialize the modules, then the applications, each concurrently in a thread pool.
+        The apps and modules are imported from the registry only when enabled, the lazy apps when first shown.
+
+        :param on_progress: Called with the name of each component initialized, the number of components initialized and the total (default is None).
         """
         logger.debug("[AppManager] Initializing apps.")
         try:
-            cls.modules = cls.load_modules()
-            cls.apps = cls.load_apps()
+            Registry.discover()
+            callbacks = cls.get_callbacks()
+            lazy_apps = [
+                LazyApplication(app_name, callbacks)
+                for app_name in cls.get_configured_app_names()
+            ]
+            # Imported one by one before the thread pool, so the import times are not mixed up
+            module_factories = {
+                module_name: Registry.get_module_class(module_name)
+                for module_name in cls.get_required_module_names(lazy_apps)
+            }
+            # Apps rendering in a worker process are built at boot, their worker being started at the end of the boot
+            app_factories = {
+                lazy_app.app_name: lazy_app.load
+                for lazy_app in lazy_apps
+                if lazy_app.enabled
+                and (not lazy_app.lazy_load or lazy_app.render_in_process)
+            }
+            for app_name in app_factories:
+                Registry.get_app_class(app_name)
+            progress = Progress(len(module_factories) + len(app_factories), on_progress)
+            cls.modules = cls.build_concurrently(module_factories, progress)
+            built_apps = cls.build_concurrently(app_factories, progress)
+            apps = [
+                built_apps.get(lazy_app.app_name, lazy_app) for lazy_app in lazy_apps
+            ]
+            cls.apps = cls.start_process_apps(apps)
             cls.enabled_apps = [app for app in cls.apps if app.enabled]
             cls.carousel = cls.filter_apps_for_carousel()
+            cls.build_routes()
+            cls.evictable_apps = [
+                app
+                for app in cls.enabled_apps
+                if isinstance(app, LazyApplication) and app.idle_eviction_in_seconds > 0
+            ]
+            Registry.log_import_report()
             logger.debug("[AppManager] All enabled app initialized.")
         except Exception as e:
             logger.critical(f"[AppManager] Failed to initialize apps: {e}")
@@ -38,26 +93,13 @@ class AppManager:
             sys.exit(1)
 
     @staticmethod
-    def load_modules() -> Dict[str, Module]:
+    def get_callbacks() -> Dict[str, Callable]:
         """
-        Load and initialize the modules.
+        Get the callbacks given to the apps.
 
-        :return: Dict[str, Module]: A dictionary of initialized modules.
+        :return: Dict[str, Callable]: The callbacks, by name.
         """
         return {
-            # "notifications": modules.notification_module.Notifications(),
-            # "weather": modules.weather_module.WeatherModule(),
-            # "spotify": modules.spotify_module.SpotifyModule(),
-        }
-
-    @staticmethod
-    def load_apps() -> List[Application]:
-        """
-        Load and initialize the apps.
-
-        :return: List[Application]: A list of initialized applications.
-        """
-        callbacks: Dict[str, Callable] = {
             "toggle_display": AppManager.toggle_display,
             "switch_next_app": AppManager.switch_next_app,
             "switch_prev_app": AppManager.switch_prev_app,
@@ -66,17 +108,102 @@ class AppManager:
             "get_app_by_name": AppManager.get_app_by_name,
             "get_module_by_name": AppManager.get_module_by_name,
         }
+
+    @staticmethod
+    def get_configured_app_names() -> List[str]:
+        """
+        Get the names of the registered apps with a section in the configuration, in the order of the registry.
+
+        :return: List[str]: The names of the apps.
+        """
+        for app_name in Configuration.get("Apps", default={}):
+            if app_name not in Registry.apps and Configuration.get_from_app(
+                app_name, "enabled", default=False
+            ):
+                logger.warning(
+                    f"[AppManager] App '{app_name}' is enabled but not registered, ignored."
+                )
+        return [
+            app_name
+            for app_name in Registry.apps
+            if Configuration.get_from_app(app_name) is not None
+        ]
+
+    @staticmethod
+    def get_required_module_names(apps: List[LazyApplication]) -> List[str]:
+        """
+        Get the names of the modules the enabled apps depend on, in the order of the dependencies.
+
+        :param apps: The apps, with their metadata read.
+        :return: List[str]: The names of the registered modules to initialize.
+        """
+        module_names: List[str] = []
+        for app in apps:
+            if not app.enabled:
+                continue
+            for module_name in (
+                Configuration.get_from_app(app.app_name, "dependencies") or []
+            ):
+                if module_name not in Registry.modules:
+                    logger.error(
+                        f"[AppManager] Module '{module_name}' required by '{app.app_name}' is not registered."
+                    )
+                elif module_name not in module_names:
+                    module_names.append(module_name)
+        return module_names
+
+    @classmethod
+    def build_concurrently(
+        cls, factories: Dict[str, Callable[[], Any]], progress: "Progress"
+    ) -> Dict[str, Any]:
+        """
+        Call the constructors in a thread pool, so a slow constructor does not delay the others.
+
+        :param factories: The constructors, by name.
+        :param progress: The progress of the initialization, advanced as each constructor returns.
+        :return: Dict[str, Any]: The constructed components by name, in the order of the constructors.
+        """
+        if not factories:
+            return {}
+        components: Dict[str, Any] = {}
+        with ThreadPoolExecutor(
+            max_workers=cls.BOOT_WORKERS, thread_name_prefix="Boot"
+        ) as executor:
+            futures = {
+                executor.submit(factory): name for name, factory in factories.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                components[name] = future.result()
+                progress.advance(name)
+        return {name: components[name] for name in factories}
+
+    @staticmethod
+    def start_process_apps(apps: List[Application]) -> List[Application]:
+        """
+        Move the frame generation of the running apps configured to render in a worker process.
+
+        :param apps: List[Application]: The initialized applications.
+        :return: List[Application]: The applications, wrapped when rendering in a worker process.
+        """
         return [
-            main_screen.MainScreen(callbacks),
-            gif_viewer.GifPlayer(callbacks),
-            pomodoro.Pomodoro(callbacks),
-            # life.GameOfLifeScreen(callbacks),
-            # weather.WeatherScreen(config, modules, callbacks),
-            # notion.NotionScreen(config, modules, callbacks),
-            # subcount.SubcountScreen(config, modules, callbacks),
-            # spotify_player.SpotifyScreen(config, modules, callbacks),
+            (
+                ProcessApplication(app)
+                if app.status == ServiceStatus.RUNNING and app.render_in_process
+                else app
+            )
+            for app in apps
         ]
 
+    @classmethod
+    def stop_apps(cls) -> None:
+        """
+        Stop the worker processes of the apps rendering out of the main process.
+        """
+        for app in cls.apps:
+            if isinstance(app, ProcessApplication):
+                app.close()
+
     @classmethod
     def filter_apps_for_carousel(cls) -> List[Application]:
         """
@@ -91,6 +218,69 @@ class AppManager:
             or app.horizontal_replacement_app_name is not None
         ]
 
+    @classmethod
+    def build_routes(cls) -> None:
+        """
+        Compute the app shown for each slot of the carousel and tilt state, following the replacement apps.
+        To be called again when the configuration of the apps is reloaded.
+        """
+        apps_by_name = {app.name: app for app in cls.enabled_apps}
+        cls.routes = {
+            (slot, tilt_state): cls.route(app, tilt_state, apps_by_name)
+            for slot, app in enumerate(cls.carousel)
+            for tilt_state in TiltState
+        }
+        cls.shown_app = None
+        logger.debug(f"[AppManager] {len(cls.routes)} routes computed.")
+
+    @staticmethod
+    def route(
+        app: Application, tilt_state: TiltState, apps_by_name: Dict[str, Application]
+    ) -> Application:
+        """
+        Follow the replacement apps from an app of the carousel until one provides content for the tilt state.
+        The app of the carousel is shown itself when it has no replacement, or when the replacements are
+        missing, do not provide content or loop.
+
+        :param app: The app of the carousel.
+        :param tilt_state: The tilt state of the device.
+        :param apps_by_name: The enabled apps by name.
+        :return: Application: The app to show.
+        """
+        chain = [app]
+        while True:
+            current_app = chain[-1]
+            if tilt_state is TiltState.HORIZONTAL:
+                provides_content = current_app.provides_horizontal_content
+                replacement_app_name = current_app.horizontal_replacement_app_name
+            else:
+                provides_content = current_app.provides_vertical_content
+                replacement_app_name = current_app.vertical_replacement_app_name
+            if provides_content:
+                return current_app
+            if not replacement_app_name:
+                if len(chain) > 1:
+                    logger.error(
+                        f"[AppManager] '{current_app.name}' replacing '{app.name}' has no {tilt_state.name.lower()} content."
+                    )
+                return app
+
+            replacement_app = apps_by_name.get(replacement_app_name)
+            if replacement_app is None:
+                logger.error(
+                    f"[AppManager] Replacement app '{replacement_app_name}' of '{current_app.name}' not found."
+                )
+                return app
+            if replacement_app in chain:
+                logger.error(
+                    f"[AppManager] Replacement cycle in {tilt_state.name.lower()} orientation: "
+                    + " -> ".join(
+                        chained_app.name for chained_app in chain + [replacement_app]
+                    )
+                )
+                return app
+            chain.append(replacement_app)
+
     @classmethod
     def get_app_by_name(cls, app_name: str) -> Optional[Application]:
         """
@@ -101,7 +291,7 @@ class AppManager:
         """
         for app in cls.enabled_apps:
             if app.name == app_name:
-                return app
+                return cls.resolve(app)
         logger.error(f"[AppManager] Application '{app_name}' not found.")
         return None
 
@@ -117,26 +307,152 @@ class AppManager:
             return cls.modules[module_name]
         raise ValueError(f"Module '{module_name}' not found.")
 
+    @classmethod
+    def get_current_app_name(cls) -> str:
+        """
+        Get the name of the application shown for the current slot of the carousel and tilt state, without building it.
+
+        :return: str: The name of the current application.
+        """
+        return cls.routes[(cls.current_app_index, Board.tilt_state)].name
+
     @classmethod
     def get_current_app(cls) -> Application:
         """
-        Get the current application.
+        Get the application shown for the current slot of the carousel and tilt state, built if it is lazy and shown for the first time.
+        The applications are notified when they are shown and hidden.
 
         Returns:
             Any: The current application.
         """
-        return cls.carousel[cls.current_app_index]
+        cls.evict_idle_apps()
+        app = cls.resolve(cls.routes[(cls.current_app_index, Board.tilt_state)])
+        if app is not cls.shown_app:
+            cls.show_app(app)
+        return app
+
+    @classmethod
+    def show_app(cls, app: Application) -> None:
+        """
+        Notify the application shown until now that it is hidden, then the new one that it is shown.
+
+        :param app: The application now shown.
+        """
+        if cls.shown_app is not None:
+            cls.notify(cls.shown_app, "on_exit")
+        cls.notify(app, "on_enter")
+        cls.shown_app = app
+        logger.debug(f"[AppManager] Showing {app.name}.")
+
+    @classmethod
+    def suspend_apps(cls) -> None:
+        """
+        Notify the application shown that it is hidden, then the built applications and the modules that the display is off.
+        The applications not built yet are not built to be notified.
+        """
+        if cls.shown_app is not None:
+            cls.notify(cls.shown_app, "on_exit")
+            cls.shown_app = None
+        for component in cls.get_built_apps() + list(cls.modules.values()):
+            cls.notify(component, "suspend")
+        logger.debug("[AppManager] Apps and modules suspended.")
+
+    @classmethod
+    def resume_apps(cls) -> None:
+        """
+        Notify the modules and the built applications that the display is on again.
+        The application shown is notified on its next frame.
+        """
+        for component in list(cls.modules.values()) + cls.get_built_apps():
+            cls.notify(component, "resume")
+        logger.debug("[AppManager] Apps and modules resumed.")
+
+    @classmethod
+    def get_built_apps(cls) -> List[Application]:
+        """
+        Get the enabled applications built, at boot or since their first show.
+
+        :return: List[Application]: The built applications.
+        """
+        return [
+            app.app if isinstance(app, LazyApplication) else app
+            for app in cls.enabled_apps
+            if not isinstance(app, LazyApplication) or app.is_loaded()
+        ]
+
+    @staticmethod
+    def notify(component: Union[Application, Module], hook: str) -> None:
+        """
+        Call a lifecycle hook of an application or a module, logging its errors.
+
+        :param component: The application or module.
+        :param hook: The name of the hook.
+        """
+        try:
+            getattr(component, hook)()
+        except Exception as e:
+            logger.error(f"[AppManager] Error in {hook} of {component.name}: {e}")
+
+    @classmethod
+    def get_neighbour_apps(cls) -> List[Application]:
+        """
+        Get the applications shown for the previous and next slots of the carousel in the current tilt state, without the current application.
+
+        :return: List[Application]: The neighbour applications, possibly lazy.
+        """
+        current_app = cls.routes[(cls.current_app_index, Board.tilt_state)]
+        neighbour_apps: List[Application] = []
+        for offset in (-1, 1):
+            slot = (cls.current_app_index + offset) % len(cls.carousel)
+            app = cls.routes[(slot, Board.tilt_state)]
+            if app is not current_app and app not in neighbour_apps:
+                neighbour_apps.append(app)
+        return neighbour_apps
+
+    @staticmethod
+    def resolve(app: Union[Application, LazyApplication]) -> Application:
+        """
+        Get the application behind a lazy application, built if needed.
+
+        :param app: The application or its lazy stand-in.
+        :return: Application: The application.
+        """
+        if isinstance(app, LazyApplication):
+            return app.load()
+        return app
+
+    @classmethod
+    def evict_idle_apps(cls) -> None:
+        """
+        Evict the lazy apps not shown for their idle eviction delay, checked once per EVICTION_CHECK_PERIOD.
+        The app shown is never evicted, nor its neighbours while they are prewarmed.
+        """
+        if not cls.evictable_apps:
+            return
+        now = time.monotonic()
+        if now - cls.last_eviction_check < cls.EVICTION_CHECK_PERIOD:
+            return
+        cls.last_eviction_check = now
+        kept_apps = cls.get_neighbour_apps() if cls.keep_neighbour_apps else []
+        for app in cls.evictable_apps:
+            if (
+                app.app is not cls.shown_app
+                and app not in kept_apps
+                and app.is_idle(now)
+            ):
+                app.unload()
 
     @classmethod
     def switch_next_app(cls) -> bool:
         """
-        Switch to the next application.
+        Switch to the next application, or further by the net encoder steps of the frame.
 
         :return: bool: True if the switch was successful, False otherwise.
         """
         try:
-            cls.current_app_index = (cls.current_app_index + 1) % len(cls.carousel)
-            logger.debug("[AppManager] Switched to next app.")
+            steps = max(1, abs(Board.get_encoder_steps()))
+            cls.current_app_index = (cls.current_app_index + steps) % len(cls.carousel)
+            logger.debug(f"[AppManager] Switched {steps} apps forward.")
             return True
         except Exception as e:
             logger.error(f"[AppManager] Failed to switch to next app: {e}")
@@ -147,13 +463,14 @@ class AppManager:
     @classmethod
     def switch_prev_app(cls) -> bool:
         """
-        Switch to the previous application.
+        Switch to the previous application, or further by the net encoder steps of the frame.
 
         :return: bool: True if the switch was successful, False otherwise.
         """
         try:
-            cls.current_app_index = (cls.current_app_index - 1) % len(cls.carousel)
-            logger.debug("[AppManager] Switched to previous app.")
+            steps = max(1, abs(Board.get_encoder_steps()))
+            cls.current_app_index = (cls.current_app_index - steps) % len(cls.carousel)
+            logger.debug(f"[AppManager] Switched {steps} apps backward.")
             return True
         except Exception as e:
             logger.error(f"[AppManager] Failed to switch to previous app: {e}")
@@ -193,6 +510,7 @@ class AppManager:
                 Board.BRIGHTNESS_MAX,
                 Board.brightness + Board.BRIGHTNESS_STEP,
             )
+            ColorCorrection.set_brightness(Board.brightness)
             logger.debug(f"[Controller] Brightness increased to {Board.brightness}")
             return True
         except Exception as e:
@@ -216,6 +534,7 @@ class AppManager:
                 Board.BRIGHTNESS_MIN,
                 Board.brightness - Board.BRIGHTNESS_STEP,
             )
+            ColorCorrection.set_brightness(Board.brightness)
             logger.debug(f"[Controller] Brightness decreased to {Board.brightness}")
             return True
         except Exception as e:
@@ -225,3 +544,24 @@ class AppManager:
                 f"[Controller] Brightness reset to default: {Board.brightness}"
             )
             return False
+
+
+class Progress:
+    """Progress of the initialization of the components, reported to a callback."""
+
+    def __init__(
+        self, total: int, on_progress: Optional[Callable[[str, int, int], None]]
+    ):
+        self.total = total
+        self.completed = 0
+        self.on_progress = on_progress
+
+    def advance(self, component_name: str) -> None:
+        """
+        Count a component as initialized and report the progress.
+
+        :param component_name: The name of the component initialized.
+        """
+        self.completed += 1
+        if self.on_progress is not None:
+            self.on_progress(component_name, self.completed, self.total)
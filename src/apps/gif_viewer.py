@@ -1,14 +1,17 @@
 import os
-from typing import Callable, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
 from loguru import logger
-from PIL import Image, ImageDraw, ImageSequence
+from PIL import Image, ImageDraw
 
 from board import Board
+from clock import Clock
 from config import Configuration
 from enums.encoder_input import EncoderInput
 from enums.service_status import ServiceStatus
 from enums.tilt_input import TiltState
+from models.animation import Animation, AnimationCache
 from models.application import Application
 from path import PathTo
 
@@ -16,6 +19,9 @@ WHITE = (230, 255, 255)
 
 
 class GifPlayer(Application):
+    BYTES_PER_MEGABYTE: int = 1024 * 1024
+    LOADER_WORKERS: int = 2
+
     def __init__(self, callbacks: Dict[str, Callable]):
         """
         Initialize the GifPlayer with callbacks.
@@ -37,8 +43,23 @@ class GifPlayer(Application):
             logger.error(
                 "[GifPlayer App] Play limit must be greater than or equal to 1."
             )
+        cache_size = Configuration.get_from_app_config(
+            self.__class__.__name__, "cache_size_in_megabytes", default=8
+        )
+        if not isinstance(cache_size, (int, float)) or cache_size <= 0:
+            self.status = ServiceStatus.ERROR_APP_CONFIG
+            logger.error(
+                "[GifPlayer App] Cache size must be a positive number of megabytes."
+            )
+            cache_size = 0
         self.led_cols = Board.led_cols
         self.led_rows = Board.led_rows
+        self.cache = AnimationCache(int(cache_size * self.BYTES_PER_MEGABYTE))
+        # GIFs are decoded in the background, the one playing is swapped once the selected one is ready
+        self.loader = self.create_loader()
+        self.loads: Dict[str, Future] = {}
+        self.animation: Optional[Animation] = None
+        self.animation_index = 0
         self.animations = self.load_animations()
         if not self.animations:
             self.status = ServiceStatus.ERROR_APP_CONFIG
@@ -47,10 +68,11 @@ class GifPlayer(Application):
             )
         self.current_animation_index = 0
         self.selection_mode = False
-        self.current_frame_index = 0
         self.was_horizontal = True
         self.auto_play_mode = False
-        self.play_count = 0
+        # The frames are chosen from the time elapsed since the current GIF started playing
+        self.animation_start = Clock.monotonic()
+        self.frame_lifetime: Optional[float] = None
 
         if self.status == ServiceStatus.ERROR_APP_CONFIG:
             logger.error(
@@ -58,6 +80,7 @@ class GifPlayer(Application):
             )
             return
 
+        self.prefetch(self.current_animation_index)
         self.status = ServiceStatus.RUNNING
         logger.info(f"[{self.__class__.__name__}] Running.")
 
@@ -72,6 +95,7 @@ class GifPlayer(Application):
         :return: Image: The generated frame.
         """
         super().generate(tilt_state, encoder_input)
+        self.frame_lifetime = None
         try:
             if encoder_input == EncoderInput.LONG_PRESS:
                 logger.debug("[GifPlayer App] Toggling selection mode.")
@@ -81,24 +105,20 @@ class GifPlayer(Application):
                 logger.debug("[GifPlayer App] Toggling auto play mode.")
                 self.auto_play_mode = not self.auto_play_mode
                 if self.auto_play_mode:
-                    self.play_count = 0
                     self.current_animation_index = (
                         self.current_animation_index + 1
                     ) % len(self.animations)
 
             if self.selection_mode:
-                if encoder_input == EncoderInput.INCREASE_CLOCKWISE:
-                    logger.debug("[GifPlayer App] Switching to next GIF.")
+                if encoder_input in [
+                    EncoderInput.INCREASE_CLOCKWISE,
+                    EncoderInput.DECREASE_COUNTERCLOCKWISE,
+                ]:
+                    steps = Board.get_encoder_steps(accelerated=True)
+                    logger.debug(f"[GifPlayer App] Switching GIF by {steps}.")
                     self.current_animation_index = (
-                        self.current_animation_index + 1
+                        self.current_animation_index + steps
                     ) % len(self.animations)
-                    self.current_frame_index = 0
-                elif encoder_input == EncoderInput.DECREASE_COUNTERCLOCKWISE:
-                    logger.debug("[GifPlayer App] Switching to previous GIF.")
-                    self.current_animation_index = (
-                        self.current_animation_index - 1
-                    ) % len(self.animations)
-                    self.current_frame_index = 0
             else:
                 if encoder_input == EncoderInput.SINGLE_PRESS:
                     self.callbacks["toggle_display"]()
@@ -107,37 +127,28 @@ class GifPlayer(Application):
                 elif encoder_input == EncoderInput.DECREASE_COUNTERCLOCKWISE:
                     self.callbacks["switch_prev_app"]()
 
-            current_gif = ImageSequence.Iterator(
-                self.animations[self.current_animation_index % len(self.animations)]
-            )
-            try:
-                frame = current_gif[self.current_frame_index].convert("RGB")
-            except IndexError:
+            now = Clock.monotonic()
+            if (
+                self.animation is not None
+                and self.auto_play_mode
+                and self.current_animation_index == self.animation_index
+                and (now - self.animation_start) * 1000 // self.animation.duration
+                >= self.play_limit
+            ):
                 logger.debug(
-                    "[GifPlayer App] Reached the end of the GIF. Restarting from the beginning."
+                    f"[GifPlayer App] GIF played {self.play_limit} times, playing the next one."
                 )
-                self.current_frame_index = 0
-                frame = current_gif[self.current_frame_index].convert("RGB")
-
-            self.current_frame_index += 1
-
-            if self.auto_play_mode:
-                frame_count = sum(
-                    1
-                    for _ in ImageSequence.Iterator(
-                        self.animations[
-                            self.current_animation_index % len(self.animations)
-                        ]
-                    )
+                self.current_animation_index = (self.current_animation_index + 1) % len(
+                    self.animations
                 )
-                if self.current_frame_index >= frame_count:
-                    self.play_count += 1
-                    if self.play_count >= self.play_limit:
-                        self.play_count = 0
-                        self.current_animation_index = (
-                            self.current_animation_index + 1
-                        ) % len(self.animations)
-                    self.current_frame_index = 0
+            self.swap_animation(now)
+
+            animation = self.animation
+            position = ((now - self.animation_start) * 1000) % animation.duration
+            # Frames due while the previous frame was shown are skipped
+            frame_index = animation.get_frame_index(position)
+            frame = animation.get_frame(frame_index)
+            self.frame_lifetime = (animation.frame_ends[frame_index] - position) / 1000
 
             draw = ImageDraw.Draw(frame)
             if self.selection_mode:
@@ -151,22 +162,157 @@ class GifPlayer(Application):
             logger.error(f"[GifPlayer App] Error generating frame: {e}")
             return self.generate_on_error()
 
-    def load_animations(self) -> List[Image.Image]:
+    def suspend(self) -> None:
+        """
+        Stops the background decoding and drops the decoded GIFs, the one playing included, until resumed.
+        """
+        if self.status == ServiceStatus.DISABLED:
+            return
+        # The decoding in progress is finished, so no loader thread outlives the suspension
+        self.loader.shutdown(wait=True, cancel_futures=True)
+        self.loads = {}
+        self.cache.clear()
+        self.animation = None
+        logger.debug("[GifPlayer App] Suspended, decoded GIFs dropped.")
+
+    def resume(self) -> None:
+        """
+        Starts the background decoding again, the selected GIF being decoded before its next frame.
+        """
+        if self.status == ServiceStatus.DISABLED:
+            return
+        self.loader = self.create_loader()
+        if self.animations:
+            self.prefetch(self.current_animation_index)
+
+    def warm(self) -> None:
+        """
+        Decodes the selected GIF in the background, so it plays right away once shown.
+        """
+        if self.status == ServiceStatus.RUNNING:
+            self.prefetch(self.current_animation_index)
+
+    def create_loader(self) -> ThreadPoolExecutor:
+        """
+        Creates the threads decoding the GIFs in the background.
+
+        :return: ThreadPoolExecutor: The loader of the GIFs.
+        """
+        return ThreadPoolExecutor(
+            max_workers=self.LOADER_WORKERS, thread_name_prefix="GifLoader"
+        )
+
+    def get_frame_lifetime(self) -> Optional[float]:
         """
-        Loads all GIFs from their respective folder.
+        Get how long the last frame stays valid, until the next frame of the GIF is due.
 
-        :return: List[Image.Image]: List of loaded GIF images.
+        :return: Optional[float]: The number of seconds until the next frame, None if unknown.
+        """
+        return self.frame_lifetime
+
+    def load_animations(self) -> List[str]:
+        """
+        Lists all GIFs from their respective folder, decoded when first shown.
+
+        :return: List[str]: List of the paths of the GIFs.
         """
         logger.debug("[GifPlayer App] Loading GIFs.")
         try:
             result = []
-            for filename in os.listdir(PathTo.GIF_FOLDER):
+            for filename in sorted(os.listdir(PathTo.GIF_FOLDER)):
                 if filename.endswith(".gif"):
                     logger.debug(f"[GifPlayer App] Loading GIF: {filename}")
-                    result.append(Image.open(os.path.join(PathTo.GIF_FOLDER, filename)))
+                    result.append(os.path.join(PathTo.GIF_FOLDER, filename))
 
             logger.info(f"[GifPlayer App] All {len(result)} GIFs loaded successfully.")
             return result
         except Exception as e:
             logger.error(f"[GifPlayer App] Error loading GIFs: {e}")
             return []
+
+    def swap_animation(self, now: float) -> None:
+        """
+        Starts playing the selected GIF once it is decoded, the current one keeps playing meanwhile.
+        The GIFs around the selected one are then decoded in the background.
+
+        :param now: float: The current time of the monotonic clock in seconds.
+        """
+        if (
+            self.animation is not None
+            and self.current_animation_index == self.animation_index
+        ):
+            return
+        # Nothing plays before the first GIF, so it is waited for, as well as every GIF while the clock is frozen
+        animation = self.get_animation(
+            self.current_animation_index,
+            wait=self.animation is None or Clock.is_frozen(),
+        )
+        if animation is None:
+            return
+        self.animation = animation
+        self.animation_index = self.current_animation_index
+        self.animation_start = now
+        # The GIFs decoded for a selection skipped past are in the cache
+        self.loads = {
+            path: future for path, future in self.loads.items() if not future.done()
+        }
+        self.prefetch(self.animation_index - 1)
+        self.prefetch(self.animation_index + 1)
+
+    def get_path(self, index: int) -> str:
+        """
+        Gets the path of a GIF.
+
+        :param index: int: The index of the GIF, wrapped around the list of GIFs.
+        :return: str: The path of the GIF.
+        """
+        return self.animations[index % len(self.animations)]
+
+    def get_animation(self, index: int, wait: bool = False) -> Optional[Animation]:
+        """
+        Gets the decoded frames of a GIF, decoding it in the background if it is not in the cache.
+
+        :param index: int: The index of the GIF, wrapped around the list of GIFs.
+        :param wait: bool: Whether to wait for the GIF to be decoded (default is False).
+        :return: Optional[Animation]: The decoded GIF, None if it is not decoded yet.
+        """
+        path = self.get_path(index)
+        if path not in self.loads:
+            animation = self.cache.get(path)
+            if animation is not None:
+                return animation
+            self.prefetch(index)
+        future = self.loads[path]
+        if not wait and not future.done():
+            return None
+        del self.loads[path]
+        # Raises the error of the decoding, if any
+        return future.result()
+
+    def prefetch(self, index: int) -> None:
+        """
+        Decodes a GIF in the background if it is neither in the cache nor being decoded.
+
+        :param index: int: The index of the GIF, wrapped around the list of GIFs.
+        """
+        path = self.get_path(index)
+        if path in self.loads or path in self.cache:
+            return
+        logger.debug(f"[GifPlayer App] Decoding {path} in the background.")
+        future = self.loader.submit(
+            self.cache.load, path, (self.led_cols, self.led_rows)
+        )
+        future.add_done_callback(lambda _: self.on_animation_loaded(path))
+        self.loads[path] = future
+
+    def on_animation_loaded(self, path: str) -> None:
+        """
+        Asks for a new frame when the GIF waited for is decoded, from the loader thread.
+
+        :param path: str: The path of the decoded GIF.
+        """
+        if (
+            self.current_animation_index != self.animation_index
+            and self.get_path(self.current_animation_index) == path
+        ):
+            self.request_refresh()
@@ -1,39 +1,37 @@
 import os
 import random
-from datetime import datetime, timedelta
+from typing import Callable, Dict
 
 import numpy as np
 from loguru import logger
-from PIL import Image, ImageDraw
+from PIL import Image
 from scipy.signal import convolve2d
 
 from board import Board
-from config import Configuration
 from enums.encoder_input import EncoderInput
-from enums.variable_importance import Importance
+from enums.input_event_type import InputEventType
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
+from input_bus import InputBus
+from models.application import Application
+from models.input_event import InputEvent
 from path import PathTo
 
 
-class GameOfLifeScreen:
-    def __init__(self, modules, callbacks):
+class GameOfLife(Application):
+    def __init__(self, callbacks: Dict[str, Callable]):
         """
-        Initialize the GameOfLifeScreen with configuration, modules, and default actions.
+        Initialize the GameOfLife with callbacks.
 
-        Args:
-            config (Dict): Configuration settings.
-            modules (Dict): Dictionary of modules.
-            default_actions (Dict[str, Callable]): Dictionary of callback functions.
+        :param callbacks: Dict[str, Callable]: Dictionary of callback functions.
         """
-        self.enabled = Configuration.read_variable(
-            "Apps", "GameOfLife", "enabled", Importance.REQUIRED
-        )
-        if not self.enabled:
-            logger.debug("[GameOfLife] GameOfLife is disabled.")
+        super().__init__(callbacks)
+        if self.status == ServiceStatus.DISABLED:
+            logger.info(
+                f"[{self.__class__.__name__}] Stopped initialization due to disabled status."
+            )
             return
 
-        logger.debug("[GameOfLife] Initializing GameOfLifeScreen.")
-        self.modules = modules
-        self.callbacks = callbacks
         self.color = (255, 255, 255)
         self.initial_states = [
             generate_random_state,
@@ -48,54 +46,62 @@ class GameOfLifeScreen:
             ),
         ]
         self.current_state_index = 0
-        self.state = self.initial_states[self.current_state_index]()
-        
-        logger.debug("[GameOfLife] GameOfLifeScreen initialized.")
+        try:
+            self.state = self.initial_states[self.current_state_index]()
+        except Exception as e:
+            self.status = ServiceStatus.ERROR_APP_CONFIG
+            logger.error(f"[GameOfLife App] Failed to load initial state: {e}")
+
+        if self.status == ServiceStatus.ERROR_APP_CONFIG:
+            logger.error(
+                f"[{self.__class__.__name__}] Application configuration errors, please check the configuration before restarting."
+            )
+            return
 
-    def generate(self, is_horizontal: bool, input_status: EncoderInput) -> Image.Image:
-        """
-        Generate the frame to draw on the LED matrix.
+        InputBus.subscribe(self, self.on_gesture, InputEventType.GESTURE)
 
-        Args:
-            is_horizontal (bool): Whether the LED matrix is horizontal.
-            input_status (InputStatus): The current input status.
+        self.status = ServiceStatus.RUNNING
+        logger.info(f"[{self.__class__.__name__}] Running.")
 
-        Returns:
-            Image.Image: The generated frame.
+    def on_gesture(self, event: InputEvent) -> None:
         """
-        if input_status in [
-            EncoderInput.SINGLE_PRESS,
-            EncoderInput.LONG_PRESS,
-        ]:
-            if input_status == EncoderInput.LONG_PRESS:
-                self.current_state_index = (self.current_state_index + 1) % len(
-                    self.initial_states
-                )
-            self.state = self.initial_states[self.current_state_index]()
-            self.color = generate_new_color()
-        elif input_status == EncoderInput.INCREASE_CLOCKWISE:
-            self.callbacks["switch_next_app"]()
-        elif input_status == EncoderInput.DECREASE_COUNTERCLOCKWISE:
-            self.callbacks["switch_prev_app"]()
-
-        end_time = datetime.now() + timedelta(seconds=0.1)
+        Restart the game on a single press, with the next initial state on a long press.
 
-        old_state = self.state
-        frame = Image.new("RGB", (Board.led_cols, Board.led_rows), (0, 0, 0))
-        draw = ImageDraw.Draw(frame)
+        :param event: InputEvent: The gesture event of the encoder button.
+        """
+        if event.value not in [EncoderInput.SINGLE_PRESS, EncoderInput.LONG_PRESS]:
+            return
+        if event.value == EncoderInput.LONG_PRESS:
+            self.current_state_index = (self.current_state_index + 1) % len(
+                self.initial_states
+            )
+        self.state = self.initial_states[self.current_state_index]()
+        self.color = generate_new_color()
 
-        new_state = life_step(old_state)
-        for i in range(Board.led_rows):
-            for j in range(Board.led_cols):
-                if new_state[i][j] == 1:
-                    draw.point((j, i), fill=self.color)
+    def generate(self, tilt_state: TiltState, encoder_input: EncoderInput) -> Image:
+        """
+        Generate the frame to draw on the LED matrix.
 
-        self.state = new_state
+        :param tilt_state: TiltState: The current tilt state of the device.
+        :param encoder_input: EncoderInput: The status of the encoder input.
+        :return: Image: The generated frame.
+        """
+        super().generate(tilt_state, encoder_input)
+        try:
+            if encoder_input == EncoderInput.INCREASE_CLOCKWISE:
+                self.callbacks["switch_next_app"]()
+            elif encoder_input == EncoderInput.DECREASE_COUNTERCLOCKWISE:
+                self.callbacks["switch_prev_app"]()
 
-        while datetime.now() < end_time:
-            pass
+            self.state = life_step(self.state)
 
-        return frame
+            pixels = np.zeros((Board.led_rows, Board.led_cols, 3), dtype=np.uint8)
+            pixels[self.state.astype(bool)] = self.color
+            return Image.fromarray(pixels, "RGB")
+        except Exception as e:
+            self.status = ServiceStatus.ERROR_APP_INTERNAL
+            logger.error(f"[GameOfLife App] Error generating frame: {e}")
+            return self.generate_on_error()
 
 
 def life_step(state: np.ndarray) -> np.ndarray:
@@ -190,4 +196,3 @@ def convert_image(location: str):
     np.save(
         location + ".npy", (image_array[0:height, 0:width, 0] // 255).astype("int32")
     )
-    )
@@ -1,14 +1,14 @@
 import calendar
+import math
 import os
-import time
-from datetime import datetime
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 
 from dateutil import tz
 from loguru import logger
 from PIL import Image, ImageDraw, ImageFont
 
 from board import Board
+from clock import Clock
 from config import Configuration
 from enums.encoder_input import EncoderInput
 from enums.service_status import ServiceStatus
@@ -135,11 +135,11 @@ class MainScreen(Application):
                 self.selectMode = not self.selectMode
 
             if self.selectMode:
-                if encoder_input is EncoderInput.INCREASE_CLOCKWISE:
-                    self.currentIdx += 1
-                    self.queued_frames = []
-                elif encoder_input is EncoderInput.DECREASE_COUNTERCLOCKWISE:
-                    self.currentIdx -= 1
+                if encoder_input in [
+                    EncoderInput.INCREASE_CLOCKWISE,
+                    EncoderInput.DECREASE_COUNTERCLOCKWISE,
+                ]:
+                    self.currentIdx += Board.get_encoder_steps()
                     self.queued_frames = []
             else:
                 if encoder_input is EncoderInput.SINGLE_PRESS:
@@ -150,10 +150,10 @@ class MainScreen(Application):
                     self.callbacks["switch_prev_app"]()
 
             if self.lastGenerateCall is None:
-                self.lastGenerateCall = time.time()
-            if time.time() - self.lastGenerateCall >= self.cycle_duration_in_seconds:
+                self.lastGenerateCall = Clock.time()
+            if Clock.time() - self.lastGenerateCall >= self.cycle_duration_in_seconds:
                 self.is_on_cycle = not self.is_on_cycle
-                self.lastGenerateCall = time.time()
+                self.lastGenerateCall = Clock.time()
 
             frame = self.theme_list[self.currentIdx % len(self.theme_list)]()
 
@@ -169,8 +169,29 @@ class MainScreen(Application):
             logger.error(f"[MainScreen App] Error generating frame: {e}")
             return self.generate_on_error()
 
+    def get_frame_lifetime(self) -> Optional[float]:
+        """
+        Get how long the last frame stays valid, until the next second or minute shown by the theme, or the next cycle.
+
+        :return: Optional[float]: The number of seconds the frame stays valid, None while notifications scroll.
+        """
+        if self.status != ServiceStatus.RUNNING:
+            return math.inf
+        theme = self.theme_list[self.currentIdx % len(self.theme_list)]
+        now = Clock.time()
+        if theme == self.generate_sakura_bg:
+            until_next_cycle = (
+                self.lastGenerateCall + self.cycle_duration_in_seconds - now
+            )
+            return max(0.0, min(60 - now % 60, until_next_cycle))
+        if theme == self.generate_cloud_bg:
+            if self.queued_frames:
+                return None
+            return 1 - now % 1
+        return math.inf
+
     def generate_sakura_bg(self):
-        current_time = datetime.now(tz=tz.tzlocal())
+        current_time = Clock.now(tz.tzlocal())
         month = current_time.month
         day = current_time.day
         hours = current_time.hour
@@ -226,7 +247,7 @@ class MainScreen(Application):
         return frame
 
     def generate_cloud_bg(self):
-        currentTime = datetime.now(tz=tz.tzlocal())
+        currentTime = Clock.now(tz.tzlocal())
         month = currentTime.month
         day = currentTime.day
         hours = currentTime.hour
@@ -1,11 +1,12 @@
-import time
+import math
 from datetime import timedelta
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 
 from loguru import logger
 from PIL import Image, ImageDraw, ImageFont
 
 from board import Board
+from clock import Clock
 from config import Configuration
 from enums.encoder_input import EncoderInput
 from enums.service_status import ServiceStatus
@@ -79,7 +80,7 @@ class Pomodoro(Application):
         self.canvas_height = Board.led_rows
         self.cycle_order = "WSWSWL"
         self.cycle_idx = 0
-        self.status = ""
+        self.cycle_status = ""
         self.time_left = None
         self.last_update_time = None
 
@@ -104,17 +105,17 @@ class Pomodoro(Application):
         try:
             if encoder_input is EncoderInput.SINGLE_PRESS:
                 self.active = not self.active
-                self.last_update_time = time.time()
+                self.last_update_time = Clock.time()
                 if self.active and self.time_left is None:
                     status = self.cycle_order[self.cycle_idx]
                     if status == "W":
-                        self.status = "W"
+                        self.cycle_status = "W"
                         self.time_left = self.work_duration
                     elif status == "S":
-                        self.status = "S"
+                        self.cycle_status = "S"
                         self.time_left = self.short_duration
                     elif status == "L":
-                        self.status = "L"
+                        self.cycle_status = "L"
                         self.time_left = self.long_duration
                     self.cycle_idx += 1
                     if self.cycle_idx >= len(self.cycle_order):
@@ -126,9 +127,9 @@ class Pomodoro(Application):
 
             if self.active:
                 self.time_left = self.time_left - timedelta(
-                    seconds=(time.time() - self.last_update_time)
+                    seconds=(Clock.time() - self.last_update_time)
                 )
-                self.last_update_time = time.time()
+                self.last_update_time = Clock.time()
 
                 if self.time_left <= timedelta(seconds=0):
                     print("time is up")
@@ -152,29 +153,29 @@ class Pomodoro(Application):
             #             draw.text((0,7), self.status + " is Over", (255,255,255), font=self.font)
             # else:
             bg_color = (255, 126, 109)
-            if self.status == "W":
+            if self.cycle_status == "W":
                 bg_color = (255, 126, 109)
-            elif self.status == "S":
+            elif self.cycle_status == "S":
                 bg_color = (142, 202, 255)
-            elif self.status == "L":
+            elif self.cycle_status == "L":
                 bg_color = (43, 156, 255)
 
             frame = Image.new("RGB", (self.canvas_height, self.canvas_width), bg_color)
             draw = ImageDraw.Draw(frame)
 
-            if self.status != "":
-                if self.status == "W":
+            if self.cycle_status != "":
+                if self.cycle_status == "W":
                     draw.text((1, 7), "Work", (255, 255, 255), font=self.font)
-                elif self.status == "S":
+                elif self.cycle_status == "S":
                     draw.text((1, 7), "Short", (255, 255, 255), font=self.font)
                     draw.text((1, 13), "Break", (255, 255, 255), font=self.font)
-                elif self.status == "L":
+                elif self.cycle_status == "L":
                     draw.text((1, 7), "Long", (255, 255, 255), font=self.font)
                     draw.text((1, 13), "Break", (255, 255, 255), font=self.font)
 
                 if self.time_left is None:
                     y_loc = 19
-                    if self.status == "W":
+                    if self.cycle_status == "W":
                         y_loc = 13
                     draw.text((1, y_loc), "Is Over", (255, 255, 255), font=self.font)
                 else:
@@ -197,3 +198,14 @@ class Pomodoro(Application):
             logger.error(f"[PomodoroScreen App] Error generating frame: {e}")
             return self.generate_on_error()
             return self.generate_on_error()
+
+    def get_frame_lifetime(self) -> Optional[float]:
+        """
+        Get how long the last frame stays valid, until the rounded seconds left change while the timer runs.
+
+        :return: Optional[float]: The number of seconds the frame stays valid, math.inf while the timer is paused.
+        """
+        if self.status != ServiceStatus.RUNNING or not self.active:
+            return math.inf
+        seconds_left = self.time_left.total_seconds()
+        return max(0.0, min(seconds_left, (seconds_left - 0.5) % 1))
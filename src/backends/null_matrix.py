@@ -0,0 +1,52 @@
+from typing import Any
+
+from PIL import Image
+
+
+class NullCanvas:
+    """Frame canvas discarding everything drawn on it."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+    def SetImage(
+        self, image: Image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True
+    ) -> None:
+        pass
+
+    def Clear(self) -> None:
+        pass
+
+    def Fill(self, red: int, green: int, blue: int) -> None:
+        pass
+
+    def SetPixel(self, x: int, y: int, red: int, green: int, blue: int) -> None:
+        pass
+
+
+class NullMatrix(NullCanvas):
+    """Matrix with the same API as 'rpi-rgb-led-matrix', discarding all frames to run headless."""
+
+    def __init__(self, options: Any):
+        super().__init__(options.cols, options.rows)
+        self.brightness = options.brightness
+
+    def CreateFrameCanvas(self) -> NullCanvas:
+        return NullCanvas(self.width, self.height)
+
+    def SwapOnVSync(
+        self, canvas: NullCanvas, framerate_fraction: int = 1
+    ) -> NullCanvas:
+        return canvas
+
+
+class NullMatrixOptions:
+    """Options of the null matrix, mirroring the ones of 'rpi-rgb-led-matrix'."""
+
+    def __init__(self):
+        self.rows = 32
+        self.cols = 64
+        self.brightness = 100
+        self.disable_hardware_pulsing = False
+        self.hardware_mapping = "regular"
@@ -0,0 +1,220 @@
+import mmap
+import os
+import struct
+import time
+from typing import Any, Iterator, Optional, Tuple
+
+from loguru import logger
+from PIL import Image
+
+
+class FrameRecording:
+    """Fixed-size memory-mapped ring file of timestamped raw RGB frames."""
+
+    MAGIC: bytes = b"CRSLREC1"
+    # Magic, width, height, capacity in frames, number of frames written since creation
+    HEADER_FORMAT: str = "<8sIIIQ"
+    HEADER_SIZE: int = 64
+    FRAMES_WRITTEN_OFFSET: int = 20
+    TIMESTAMP_FORMAT: str = "<d"
+    TIMESTAMP_SIZE: int = 8
+
+    def __init__(self, path: str, file_map: mmap.mmap, writable: bool = True):
+        """
+        Initialize the recording from a mapped ring file, use create or open instead.
+
+        :param path: str: The path of the ring file.
+        :param file_map: mmap.mmap: The memory map of the whole ring file.
+        :param writable: bool: Whether the file is mapped for writing (default is True).
+        """
+        magic, self.width, self.height, self.capacity, self.frames_written = (
+            struct.unpack_from(self.HEADER_FORMAT, file_map, 0)
+        )
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a frame recording.")
+        self.path = path
+        self.file_map = file_map
+        self.writable = writable
+        self.frame_size = self.width * self.height * 3
+        self.record_size = self.TIMESTAMP_SIZE + self.frame_size
+        self.blank_frame = bytes(self.frame_size)
+
+    @classmethod
+    def get_file_size(cls, width: int, height: int, capacity: int) -> int:
+        """
+        Compute the size of a ring file.
+
+        :param width: int: The width of the frames.
+        :param height: int: The height of the frames.
+        :param capacity: int: The number of frames kept in the ring.
+        :return: int: The size of the file in bytes.
+        """
+        return cls.HEADER_SIZE + capacity * (cls.TIMESTAMP_SIZE + width * height * 3)
+
+    @classmethod
+    def create(
+        cls, path: str, width: int, height: int, capacity: int
+    ) -> "FrameRecording":
+        """
+        Open the ring file for recording, keeping the frames already recorded if the geometry matches.
+
+        :param path: str: The path of the ring file.
+        :param width: int: The width of the frames.
+        :param height: int: The height of the frames.
+        :param capacity: int: The number of frames kept in the ring.
+        :return: FrameRecording: The recording, ready to write.
+        """
+        size = cls.get_file_size(width, height, capacity)
+        try:
+            recording = cls.open(path, writable=True)
+            if (recording.width, recording.height, recording.capacity) == (
+                width,
+                height,
+                capacity,
+            ):
+                logger.info(
+                    f"[Recorder] Resuming recording after {recording.frames_written} frames in {path}"
+                )
+                return recording
+            recording.close()
+        except (OSError, ValueError, struct.error):
+            pass
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w+b") as f:
+            f.truncate(size)
+            file_map = mmap.mmap(f.fileno(), size)
+        struct.pack_into(
+            cls.HEADER_FORMAT, file_map, 0, cls.MAGIC, width, height, capacity, 0
+        )
+        logger.info(f"[Recorder] Created recording of {capacity} frames in {path}")
+        return cls(path, file_map)
+
+    @classmethod
+    def open(cls, path: str, writable: bool = False) -> "FrameRecording":
+        """
+        Open an existing ring file.
+
+        :param path: str: The path of the ring file.
+        :param writable: bool: Whether to open the file for writing (default is False).
+        :return: FrameRecording: The recording.
+        """
+        with open(path, "r+b" if writable else "rb") as f:
+            file_map = mmap.mmap(
+                f.fileno(),
+                0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+        return cls(path, file_map, writable)
+
+    def write(self, frame: Optional[Image.Image], timestamp: float) -> None:
+        """
+        Write a frame in the next slot of the ring, overwriting the oldest frame once the ring is full.
+
+        :param frame: Optional[Image.Image]: The RGB frame at the size of the recording, None for a blank frame.
+        :param timestamp: float: The time the frame was presented, in seconds since the epoch.
+        """
+        offset = (
+            self.HEADER_SIZE + (self.frames_written % self.capacity) * self.record_size
+        )
+        struct.pack_into(self.TIMESTAMP_FORMAT, self.file_map, offset, timestamp)
+        offset += self.TIMESTAMP_SIZE
+        self.file_map[offset : offset + self.frame_size] = (
+            self.blank_frame if frame is None else frame.tobytes()
+        )
+        self.frames_written += 1
+        struct.pack_into(
+            "<Q", self.file_map, self.FRAMES_WRITTEN_OFFSET, self.frames_written
+        )
+
+    def frames(self) -> Iterator[Tuple[float, Image.Image]]:
+        """
+        Iterate over the frames of the ring, from the oldest to the latest.
+
+        :return: Iterator[Tuple[float, Image.Image]]: The timestamp and the frame of each record.
+        """
+        count = min(self.frames_written, self.capacity)
+        first = self.frames_written - count
+        for index in range(first, self.frames_written):
+            offset = self.HEADER_SIZE + (index % self.capacity) * self.record_size
+            (timestamp,) = struct.unpack_from(
+                self.TIMESTAMP_FORMAT, self.file_map, offset
+            )
+            offset += self.TIMESTAMP_SIZE
+            frame = Image.frombytes(
+                "RGB",
+                (self.width, self.height),
+                bytes(self.file_map[offset : offset + self.frame_size]),
+            )
+            yield timestamp, frame
+
+    def close(self) -> None:
+        """
+        Flush and unmap the ring file.
+        """
+        if not self.file_map.closed:
+            if self.writable:
+                self.file_map.flush()
+            self.file_map.close()
+
+
+class RecorderCanvas:
+    """Frame canvas of the recorder, keeping track of the frame drawn on the canvas it wraps."""
+
+    def __init__(self, canvas: Any):
+        self.canvas = canvas
+        self.frame: Optional[Image.Image] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.canvas, name)
+
+    def SetImage(
+        self, image: Image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True
+    ) -> None:
+        self.frame = image
+        self.canvas.SetImage(image, offset_x, offset_y, unsafe)
+
+    def Clear(self) -> None:
+        self.frame = None
+        self.canvas.Clear()
+
+
+class RecorderMatrix:
+    """Matrix backend appending every frame presented by the matrix it wraps to a frame recording."""
+
+    def __init__(self, matrix: Any, recording: FrameRecording):
+        self.matrix = matrix
+        self.recording = recording
+        self.size = (recording.width, recording.height)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.matrix, name)
+
+    @property
+    def brightness(self) -> int:
+        return self.matrix.brightness
+
+    @brightness.setter
+    def brightness(self, value: int) -> None:
+        self.matrix.brightness = value
+
+    def CreateFrameCanvas(self) -> RecorderCanvas:
+        return RecorderCanvas(self.matrix.CreateFrameCanvas())
+
+    def SwapOnVSync(
+        self, canvas: RecorderCanvas, framerate_fraction: int = 1
+    ) -> RecorderCanvas:
+        frame = canvas.frame
+        if frame is not None and (frame.mode != "RGB" or frame.size != self.size):
+            resized_frame = Image.new("RGB", self.size)
+            resized_frame.paste(frame.convert("RGB"), (0, 0))
+            frame = resized_frame
+        self.recording.write(frame, time.time())
+        return RecorderCanvas(
+            self.matrix.SwapOnVSync(canvas.canvas, framerate_fraction)
+        )
+
+    def SetImage(
+        self, image: Image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True
+    ) -> None:
+        self.matrix.SetImage(image, offset_x, offset_y, unsafe)
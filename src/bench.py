@@ -0,0 +1,121 @@
+import resource
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app_manager import AppManager
+from display import Display
+from enums.encoder_input import EncoderInput
+from enums.tilt_input import TiltState
+from frame_stats import LatencyHistogram
+from models.process_application import ProcessApplication
+
+
+class Benchmark:
+    """Headless benchmark rendering each enabled app as fast as possible."""
+
+    DEFAULT_FRAMES: int = 200
+
+    @classmethod
+    def run(cls, frames_per_app: int = DEFAULT_FRAMES) -> List[Dict[str, Any]]:
+        """
+        Renders and presents each enabled app for the given number of frames, then prints the report.
+
+        :param frames_per_app: The number of frames to render for each app.
+        :return: List[Dict[str, Any]]: The results of each app.
+        """
+        results = []
+        for app in AppManager.enabled_apps:
+            results.append(cls.run_app(app, frames_per_app))
+        cls.print_report(results)
+        return results
+
+    @classmethod
+    def run_app(cls, app: Any, frames: int) -> Dict[str, Any]:
+        """
+        Renders and presents an app for the given number of frames, in its natural orientation.
+
+        :param app: The application to benchmark.
+        :param frames: The number of frames to render.
+        :return: Dict[str, Any]: The frames per second, latency percentiles, and peak RSS of the main process and of the worker process of the app after the run.
+        """
+        logger.info(f"[Benchmark] Rendering {frames} frames of {app.name}.")
+        # Lazy apps are built before the first frame, so their load time is not counted
+        app = AppManager.resolve(app)
+        tilt_state = (
+            TiltState.HORIZONTAL
+            if app.provides_horizontal_content
+            else TiltState.VERTICAL
+        )
+        histogram = LatencyHistogram()
+        start_time = time.perf_counter()
+        for _ in range(frames):
+            frame_start_time = time.perf_counter()
+            frame = app.generate(tilt_state, EncoderInput.NOTHING)
+            Display.present(frame)
+            histogram.record(time.perf_counter() - frame_start_time)
+        elapsed = time.perf_counter() - start_time
+
+        return {
+            "app": app.name,
+            "fps": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+            **histogram.summary(),
+            "peak_rss_mb": cls.get_peak_rss_in_megabytes(),
+            "worker_rss_mb": cls.get_worker_peak_rss_in_megabytes(app),
+        }
+
+    @staticmethod
+    def get_peak_rss_in_megabytes() -> float:
+        """
+        Returns the peak resident set size of the main process, the worker processes excluded.
+
+        :return: float: The peak RSS in megabytes.
+        """
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+    @staticmethod
+    def get_worker_peak_rss_in_megabytes(app: Any) -> Optional[float]:
+        """
+        Returns the peak resident set size of the worker process of an app, read from /proc while it is running.
+
+        :param app: The application, wrapped when rendering in a worker process.
+        :return: Optional[float]: The peak RSS in megabytes, None if the app renders in the main process or the worker is not readable.
+        """
+        if not isinstance(app, ProcessApplication):
+            return None
+        try:
+            with open(f"/proc/{app.process.pid}/status") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        return round(int(line.split()[1]) / 1024, 1)
+        except OSError as e:
+            logger.warning(f"[Benchmark] Could not read the worker of {app.name}: {e}")
+        return None
+
+    @staticmethod
+    def print_report(results: List[Dict[str, Any]]) -> None:
+        """
+        Prints the results as a table.
+
+        :param results: The results of each app.
+        """
+        columns = [
+            "fps",
+            "p50_ms",
+            "p95_ms",
+            "p99_ms",
+            "max_ms",
+            "peak_rss_mb",
+            "worker_rss_mb",
+        ]
+        name_width = max([len("app")] + [len(result["app"]) for result in results])
+        print("app".ljust(name_width) + "".join(column.rjust(15) for column in columns))
+        for result in results:
+            print(
+                result["app"].ljust(name_width)
+                + "".join(
+                    ("-" if result[column] is None else str(result[column])).rjust(15)
+                    for column in columns
+                )
+            )
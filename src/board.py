@@ -1,28 +1,37 @@
-import queue
-import time
-from typing import Any
+from typing import Any, List
 
-from gpiozero import Button, RotaryEncoder
-from gpiozero.pins.pigpio import PiGPIOFactory
+from gpiozero import Button, Factory, RotaryEncoder
 from loguru import logger
 
+from color_correction import ColorCorrection
 from config import Configuration
 from custom_frames import CustomFrames
+from display import Display
 from enums.encoder_input import EncoderInput
+from enums.input_event_type import InputEventType
+from enums.matrix_backend import MatrixBackend
 from enums.tilt_input import TiltState
+from gesture_recognizer import GestureRecognizer
+from input_bus import InputBus
+from models.input_event import InputEvent
+from path import PathTo
 
 # TODO: separate the Matrix from the IO, rename the calss to IO and create a Matrix class for example
 
 class Board:
     """Class to manage the board's hardware components and their interactions."""
 
-    factory: PiGPIOFactory = PiGPIOFactory()
+    factory: Factory
     SCREEN_RATIO: int = 16
     FIRST_GPIO_PIN: int = 0
     LAST_GPIO_PIN: int = 27
     BRIGHTNESS_MIN: int = 0
     BRIGHTNESS_MAX: int = 100
     BRIGHTNESS_STEP: int = 5
+    # Rotation speed in detents per second from which the acceleration applies
+    ACCELERATION_MIN_VELOCITY: float = 10.0
+    # Maximum time between two detents for them to be part of the same spin
+    ACCELERATION_WINDOW: float = 0.5
 
     led_rows: int
     led_cols: int
@@ -35,12 +44,20 @@ class Board:
     encoder: RotaryEncoder
     encoder_sw: int
     encoder_button: Button
+    gesture_recognizer: GestureRecognizer
     tilt_switch: int
     tilt_switch_button: Button
     tilt_switch_bounce_time: float
     is_display_on: bool = True
-    encoder_queue: queue.Queue
     encoder_state: int = 0
+    encoder_acceleration: float = 0.0
+    input_events: List[InputEvent] = []
+    # Input events drained from the input bus, left for the next frames
+    pending_events: List[InputEvent] = []
+    encoder_events: List[InputEvent] = []
+    encoder_steps: int = 0
+    encoder_accelerated_steps: int = 0
+    last_encoder_event_time: float = 0.0
     tilt_state: TiltState = TiltState.HORIZONTAL
     encoder_input: EncoderInput = EncoderInput.NOTHING
     matrix: Any
@@ -58,6 +75,8 @@ class Board:
             logger.warning(f"[Board] Error cleaning up encoder: {e}")
 
         try:
+            if hasattr(cls, "gesture_recognizer") and cls.gesture_recognizer:
+                cls.gesture_recognizer.reset()
             if hasattr(cls, "encoder_button") and cls.encoder_button:
                 cls.encoder_button.close()
                 logger.debug("[Board] Encoder button cleaned up.")
@@ -79,19 +98,27 @@ class Board:
         #     logger.warning(f"[Board] Error resetting GPIO factory: {e}")
 
     @classmethod
-    def init_system(cls, use_emulator: bool = False) -> None:
+    def init_system(
+        cls,
+        matrix_backend: MatrixBackend = MatrixBackend.HARDWARE,
+        use_mock_gpio: bool = False,
+        record: bool = False,
+    ) -> None:
         """
         Initializes the system components.
 
-        :param use_emulator: Whether to use the emulator for the RGB matrix (default is False).
+        :param matrix_backend: The backend driving the frames of the matrix (default is the hardware).
+        :param use_mock_gpio: Whether to use gpiozero's mock pins instead of the pigpio daemon (default is False).
+        :param record: Whether to record the presented frames to the recording file (default is False).
         """
         cls.cleanup_gpio()
 
-        cls._init_display()
-        cls.init_matrix(use_emulator=use_emulator)
+        cls.init_display()
+        cls.init_matrix(matrix_backend=matrix_backend, record=record)
         CustomFrames.init(cls.led_rows, cls.led_cols)
 
         try:
+            cls.init_factory(use_mock_gpio=use_mock_gpio)
             cls._init_encoder()
             cls._init_tilt_switch()
             logger.debug("[Board] All system components initialized.")
@@ -104,7 +131,24 @@ class Board:
             )
 
     @classmethod
-    def _init_display(cls) -> None:
+    def init_factory(cls, use_mock_gpio: bool = False) -> None:
+        """
+        Creates the GPIO pin factory, connecting to the pigpio daemon unless mock pins are used.
+
+        :param use_mock_gpio: Whether to use gpiozero's mock pins (default is False).
+        """
+        if use_mock_gpio:
+            from gpiozero.pins.mock import MockFactory
+
+            cls.factory = MockFactory()
+        else:
+            from gpiozero.pins.pigpio import PiGPIOFactory
+
+            cls.factory = PiGPIOFactory()
+        logger.debug(f"[Board] Pin factory created: {cls.factory}")
+
+    @classmethod
+    def init_display(cls) -> None:
         """
         Initializes the display settings.
         """
@@ -155,15 +199,23 @@ class Board:
         logger.info("[Board] All display settings initialized.")
 
     @classmethod
-    def init_matrix(cls, use_emulator: bool = False) -> None:
+    def init_matrix(
+        cls,
+        matrix_backend: MatrixBackend = MatrixBackend.HARDWARE,
+        record: bool = False,
+    ) -> None:
         """
         Creates an RGBMatrix object with the specified parameters.
 
-        :param use_emulator: Whether to use the emulator (default is False).
+        :param matrix_backend: The backend driving the frames of the matrix (default is the hardware).
+        :param record: Whether to record the presented frames to the recording file (default is False).
         """
-        if use_emulator:
+        if matrix_backend is MatrixBackend.EMULATOR:
             from RGBMatrixEmulator import RGBMatrix  # type: ignore
             from RGBMatrixEmulator import RGBMatrixOptions
+        elif matrix_backend is MatrixBackend.NULL:
+            from backends.null_matrix import NullMatrix as RGBMatrix
+            from backends.null_matrix import NullMatrixOptions as RGBMatrixOptions
         else:
             from rgbmatrix import RGBMatrix, RGBMatrixOptions  # type: ignore
 
@@ -181,11 +233,36 @@ class Board:
 
             cls.matrix: RGBMatrix = RGBMatrix(options=options)
             logger.debug("[Config] RGBMatrix object created.")
+            if record:
+                cls.init_recorder()
+            Display.init(cls.matrix)
+            ColorCorrection.init(cls.matrix, cls.brightness)
         except Exception as e:
             Configuration.critical_exit(
                 f"Failed to create RGBMatrix object: {e}. Please check your configuration."
             )
 
+    @classmethod
+    def init_recorder(cls) -> None:
+        """
+        Wraps the matrix in a recorder appending every presented frame to the recording file.
+        """
+        from backends.recorder_matrix import FrameRecording, RecorderMatrix
+
+        capacity = Configuration.get(
+            "System", "Recorder", "capacity_in_frames", default=1200
+        )
+        if not isinstance(capacity, int) or capacity <= 0:
+            Configuration.critical_exit(
+                "System.Recorder.capacity_in_frames must be a positive integer."
+            )
+
+        recording = FrameRecording.create(
+            PathTo.RECORDING_FILE, cls.led_cols, cls.led_rows, capacity
+        )
+        cls.matrix = RecorderMatrix(cls.matrix, recording)
+        logger.info(f"[Board] Recording frames to {PathTo.RECORDING_FILE}.")
+
     @classmethod
     def _init_encoder(cls) -> None:
         """
@@ -207,7 +284,16 @@ class Board:
                 f"System.Encoder.gpio_dt must be between {cls.FIRST_GPIO_PIN} and {cls.LAST_GPIO_PIN}."
             )
 
-        cls.encoder_queue = queue.Queue()
+        cls.encoder_acceleration = Configuration.get(
+            "System", "Encoder", "acceleration", default=0.0
+        )
+        if (
+            not isinstance(cls.encoder_acceleration, (int, float))
+            or cls.encoder_acceleration < 0
+        ):
+            Configuration.critical_exit(
+                "System.Encoder.acceleration must be a non-negative number."
+            )
 
         logger.debug(
             f"[Board] About to create RotaryEncoder on pins CLK={cls.encoder_clk}, DT={cls.encoder_dt}"
@@ -249,8 +335,12 @@ class Board:
                 bounce_time=0.1,
                 pin_factory=cls.factory,
             )
+            cls.gesture_recognizer = GestureRecognizer(cls.set_encoder_input)
             cls.encoder_button.when_pressed = (
-                lambda button: cls.encoder_button_callback(button)
+                lambda button: cls.encoder_button_pressed_callback(button)
+            )
+            cls.encoder_button.when_released = (
+                lambda button: cls.encoder_button_released_callback(button)
             )
             logger.info("[Board] Encoder button initialized.")
         except RuntimeError as e:
@@ -312,8 +402,8 @@ class Board:
         :param encoder: The RotaryEncoder instance.
         """
         logger.debug("[Board] Rotated clockwise: (+).")
-        cls.encoder_queue.put(1)
         cls.reset_encoder(encoder)
+        InputBus.publish(InputEventType.ROTATION, 1)
 
     @classmethod
     def rotate_counter_clockwise_callback(cls, encoder: RotaryEncoder) -> None:
@@ -323,8 +413,8 @@ class Board:
         :param encoder: The RotaryEncoder instance.
         """
         logger.debug("[Board] Rotated counter-clockwise: (-).")
-        cls.encoder_queue.put(-1)
         cls.reset_encoder(encoder)
+        InputBus.publish(InputEventType.ROTATION, -1)
 
     @classmethod
     def tilt_callback(cls, tilt_switch: Button) -> None:
@@ -341,55 +431,153 @@ class Board:
             logger.debug(
                 f"[Board] Orientation changed to {cls.tilt_state.name.lower()}."
             )
+            InputBus.publish(InputEventType.TILT, cls.tilt_state)
+
+    @classmethod
+    def encoder_button_pressed_callback(cls, enc_button: Button) -> None:
+        """
+        Callback function for the press of the encoder button.
+
+        :param enc_button: The Button instance for the encoder button.
+        """
+        cls.gesture_recognizer.press()
 
     @classmethod
-    def encoder_button_callback(cls, enc_button: Button) -> None:
+    def encoder_button_released_callback(cls, enc_button: Button) -> None:
         """
-        Callback function for the encoder button.
+        Callback function for the release of the encoder button.
 
         :param enc_button: The Button instance for the encoder button.
         """
-        HOLD_TIME = 1
-        DOUBLE_PRESS_TIME = 0.3
-        TRIPLE_PRESS_TIME = 0.3
-        SLEEP_INTERVAL = 0.1
+        cls.gesture_recognizer.release()
 
-        start_time = time.time()
-        time_diff = 0
+    @classmethod
+    def set_encoder_input(cls, encoder_input: EncoderInput) -> None:
+        """
+        Publishes a gesture of the encoder button on the input bus.
 
-        while enc_button.is_active and (time_diff < HOLD_TIME):
-            time_diff = time.time() - start_time
+        :param encoder_input: The detected encoder input.
+        """
+        InputBus.publish(InputEventType.GESTURE, encoder_input)
 
-        if time_diff >= HOLD_TIME:
-            logger.debug("[Board] Long press detected (5).")
-            cls.encoder_input = EncoderInput.LONG_PRESS
-        else:
-            enc_button.when_pressed = None
-            start_time = time.time()
-            while time.time() - start_time <= DOUBLE_PRESS_TIME:
-                time.sleep(SLEEP_INTERVAL)
-                if enc_button.is_pressed:
-                    time.sleep(SLEEP_INTERVAL)
-                    new_start_time = time.time()
-                    while time.time() - new_start_time <= TRIPLE_PRESS_TIME:
-                        time.sleep(SLEEP_INTERVAL)
-                        if enc_button.is_pressed:
-                            logger.debug("[Board] Triple press detected (3).")
-                            cls.encoder_input = EncoderInput.TRIPLE_PRESS
-                            enc_button.when_pressed = (
-                                lambda button: cls.encoder_button_callback(button)
-                            )
-                            return
-                        logger.debug("[Board] Double press detected (2).")
-                        cls.encoder_input = EncoderInput.DOUBLE_PRESS
-                        enc_button.when_pressed = (
-                            lambda button: cls.encoder_button_callback(button)
-                        )
-                        return
-            logger.debug("[Board] Single press detected (1).")
-            cls.encoder_input = EncoderInput.SINGLE_PRESS
-            enc_button.when_pressed = lambda button: cls.encoder_button_callback(button)
-            return
+    @classmethod
+    def apply_input_events(cls, events: List[InputEvent]) -> List[InputEvent]:
+        """
+        Converts the input events drained from the input bus to the encoder input status of the frame.
+        The encoder rotations are coalesced into a signed step count, and each gesture is delivered on its own frame,
+        so a rotation and a gesture drained together are delivered on consecutive frames, in the order they happened.
+        The events left for the next frames are kept in pending_events.
+
+        :param events: The input events drained from the input bus, oldest first.
+        :return: List[InputEvent]: The input events of the frame.
+        """
+        events = cls.take_frame_events(cls.pending_events + events)
+        cls.input_events = events
+        for event in events:
+            if event.type is InputEventType.GESTURE:
+                cls.encoder_input = event.value
+
+        cls.encoder_events = [
+            event for event in events if event.type is InputEventType.ROTATION
+        ]
+        if not cls.encoder_events:
+            return events
+
+        cls.encoder_state += sum(event.value for event in cls.encoder_events)
+        cls.set_encoder_steps(
+            cls.encoder_state,
+            cls.accelerate_encoder_steps(cls.encoder_state, cls.encoder_events),
+        )
+        cls.last_encoder_event_time = cls.encoder_events[-1].timestamp
+
+        if cls.has_encoder_increased():
+            cls.encoder_input = EncoderInput.INCREASE_CLOCKWISE
+            cls.reset_encoder_state()
+        elif cls.has_encoder_decreased():
+            cls.encoder_input = EncoderInput.DECREASE_COUNTERCLOCKWISE
+            cls.reset_encoder_state()
+        return events
+
+    @classmethod
+    def take_frame_events(cls, events: List[InputEvent]) -> List[InputEvent]:
+        """
+        Splits the input events at the first change between rotations and gestures, or at the second gesture.
+        The other events go with the encoder events around them.
+
+        :param events: The input events not delivered yet, oldest first.
+        :return: List[InputEvent]: The input events of the frame, the others are kept in pending_events.
+        """
+        encoder_event_type = None
+        for index, event in enumerate(events):
+            if event.type not in (InputEventType.ROTATION, InputEventType.GESTURE):
+                continue
+            if encoder_event_type is None:
+                encoder_event_type = event.type
+            elif (
+                event.type is not encoder_event_type
+                or event.type is InputEventType.GESTURE
+            ):
+                cls.pending_events = events[index:]
+                return events[:index]
+        cls.pending_events = []
+        return events
+
+    @classmethod
+    def has_pending_events(cls) -> bool:
+        """
+        Checks if input events are left for the next frames.
+
+        :return: bool: True if input events are pending, False otherwise.
+        """
+        return bool(cls.pending_events)
+
+    @classmethod
+    def accelerate_encoder_steps(cls, steps: int, events: List[InputEvent]) -> int:
+        """
+        Scales the steps of a tick with the rotation speed, so a fast spin scrolls further than the number of detents.
+
+        :param steps: The net number of detents of the tick.
+        :param events: The rotation events of the tick.
+        :return: int: The accelerated number of steps, the net number of detents if the acceleration is disabled.
+        """
+        if cls.encoder_acceleration == 0 or steps == 0:
+            return steps
+
+        start_time = events[0].timestamp
+        detents = len(events) - 1
+        if start_time - cls.last_encoder_event_time <= cls.ACCELERATION_WINDOW:
+            start_time = cls.last_encoder_event_time
+            detents += 1
+        duration = events[-1].timestamp - start_time
+        if detents == 0 or duration <= 0:
+            return steps
+
+        velocity = detents / duration
+        multiplier = 1 + cls.encoder_acceleration * max(
+            0.0, velocity - cls.ACCELERATION_MIN_VELOCITY
+        )
+        return round(steps * multiplier)
+
+    @classmethod
+    def set_encoder_steps(cls, steps: int, accelerated_steps: int) -> None:
+        """
+        Sets the net encoder rotation of the frame being rendered, outside of the encoder polling.
+
+        :param steps: The net number of detents.
+        :param accelerated_steps: The number of steps scaled with the rotation speed.
+        """
+        cls.encoder_steps = steps
+        cls.encoder_accelerated_steps = accelerated_steps
+
+    @classmethod
+    def get_encoder_steps(cls, accelerated: bool = False) -> int:
+        """
+        Returns the net encoder rotation of the frame being rendered, positive clockwise.
+
+        :param accelerated: Whether to scale the steps with the rotation speed, for scrolling lists (default is False).
+        :return: int: The number of steps.
+        """
+        return cls.encoder_accelerated_steps if accelerated else cls.encoder_steps
 
     @classmethod
     def reset_encoder(cls, encoder: RotaryEncoder) -> None:
@@ -410,9 +598,11 @@ class Board:
     @classmethod
     def reset_encoder_input_status(cls) -> None:
         """
-        Resets the encoder input status to NOTHING.
+        Resets the encoder input status to NOTHING, the encoder steps to 0 and forgets the input events of the frame.
         """
         cls.encoder_input = EncoderInput.NOTHING
+        cls.input_events = []
+        cls.set_encoder_steps(0, 0)
 
     @classmethod
     def has_encoder_increased(cls) -> bool:
@@ -435,26 +625,3 @@ class Board:
         if cls.encoder_state < 0:
             return True
         return False
-
-    @classmethod
-    def loading_animation(cls, duration_in_seconds: int = 10) -> None:
-        """
-        Displays a loading animation on the matrix.
-
-        :param duration_in_seconds: Duration of the loading animation in seconds (default is 10).
-        """
-        if duration_in_seconds <= 0:
-            logger.warning(
-                "[Board] Duration for loading animation must be positive. Skipped."
-            )
-            return
-        logger.debug("[Board] Starting loading animation.")
-        start_time = time.time()
-        while time.time() - start_time < duration_in_seconds:
-            frame = CustomFrames.loading(int((time.time() - start_time) * 10) % 100)
-            cls.matrix.SetImage(frame)
-            time.sleep(0.1)
-        logger.debug("[Board] Loading animation completed.")
-        cls.matrix.SetImage(CustomFrames.black())
-        logger.debug("[Board] Display cleared after loading animation.")
-        logger.debug("[Board] Display cleared after loading animation.")
@@ -0,0 +1,80 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from dateutil import tz
+
+
+class Clock:
+    """Wall clock of the applications, which can be frozen to render reproducible frames."""
+
+    frozen_at: Optional[datetime] = None
+
+    @classmethod
+    def time(cls) -> float:
+        """
+        Returns the current time, like time.time().
+
+        :return: float: The current time in seconds since the epoch.
+        """
+        if cls.frozen_at is None:
+            return time.time()
+        return cls.frozen_at.replace(tzinfo=timezone.utc).timestamp()
+
+    @classmethod
+    def monotonic(cls) -> float:
+        """
+        Returns the value of a monotonic clock, like time.monotonic(), to measure elapsed time.
+
+        :return: float: The value of the monotonic clock in seconds, the frozen time if the clock is frozen.
+        """
+        if cls.frozen_at is None:
+            return time.monotonic()
+        return cls.time()
+
+    @classmethod
+    def now(cls, tzinfo: Optional[tz.tzlocal] = None) -> datetime:
+        """
+        Returns the current date and time, like datetime.now(). A frozen clock shows the same wall time in every time zone.
+
+        :param tzinfo: The time zone of the date and time (default is None).
+        :return: datetime: The current date and time.
+        """
+        if cls.frozen_at is None:
+            return datetime.now(tz=tzinfo)
+        return cls.frozen_at.replace(tzinfo=tzinfo)
+
+    @classmethod
+    def freeze(cls, wall_time: datetime) -> None:
+        """
+        Stops the clock at the given wall time, until it is advanced or unfrozen.
+
+        :param wall_time: The naive date and time to show.
+        """
+        cls.frozen_at = wall_time
+
+    @classmethod
+    def is_frozen(cls) -> bool:
+        """
+        Returns whether the clock is frozen, time only passing when it is advanced.
+
+        :return: bool: True if the clock is frozen.
+        """
+        return cls.frozen_at is not None
+
+    @classmethod
+    def advance(cls, seconds: float) -> None:
+        """
+        Moves a frozen clock forward.
+
+        :param seconds: The number of seconds to move the clock by.
+        """
+        if cls.frozen_at is not None:
+            cls.frozen_at += timedelta(seconds=seconds)
+
+    @classmethod
+    def unfreeze(cls) -> None:
+        """
+        Restarts the clock on the system time.
+        """
+        cls.frozen_at = None
@@ -0,0 +1,129 @@
+from typing import Any, List, Optional
+
+from loguru import logger
+from PIL import Image
+
+from config import Configuration
+
+
+class ColorCorrection:
+    """Output post-processing applying the brightness, gamma and colour balance of the matrix to each frame.
+    The corrections are folded into one 256-entry lookup table per channel, mapped over the whole frame at once.
+    """
+
+    CHANNELS: int = 3
+    LEVELS: int = 256
+
+    matrix: Any = None
+    brightness: int = 100
+    gamma: List[float] = [1.0, 1.0, 1.0]
+    color_balance: List[float] = [1.0, 1.0, 1.0]
+    hardware_brightness: bool = False
+    # Lookup table of the three channels one after the other, None when the frames are left untouched
+    lookup_table: Optional[List[int]] = None
+    # Incremented whenever the lookup table changes, so the frame on screen is presented again
+    version: int = 0
+
+    @classmethod
+    def init(cls, matrix: Any, brightness: int) -> None:
+        """
+        Reads the gamma and colour balance of the matrix and builds the lookup table.
+        The brightness is applied by the matrix when it exposes a brightness, in the frames otherwise.
+
+        :param matrix: The RGBMatrix object, from 'rgbmatrix' or 'RGBMatrixEmulator'.
+        :param brightness: The brightness of the matrix, between 0 and 100.
+        """
+        cls.matrix = matrix
+        cls.gamma = cls.read_channels("gamma", 1.0)
+        if any(value <= 0 for value in cls.gamma):
+            Configuration.critical_exit(
+                "System.Matrix.gamma must be positive, as one number or one per channel."
+            )
+        cls.color_balance = cls.read_channels("color_balance", 1.0)
+        if any(value < 0 or value > 1 for value in cls.color_balance):
+            Configuration.critical_exit(
+                "System.Matrix.color_balance must be between 0 and 1, as one number or one per channel."
+            )
+        cls.hardware_brightness = hasattr(matrix, "brightness")
+        logger.debug(
+            f"[ColorCorrection] Gamma: {cls.gamma}, colour balance: {cls.color_balance}, hardware brightness: {cls.hardware_brightness}."
+        )
+        cls.set_brightness(brightness)
+
+    @staticmethod
+    def read_channels(key: str, default: float) -> List[float]:
+        """
+        Reads a correction of the matrix given as one number for all channels or as a list of one number per channel.
+
+        :param key: The key of the correction in System.Matrix.
+        :param default: The value of each channel when the key is missing.
+        :return: List[float]: The correction of the red, green and blue channels.
+        """
+        value = Configuration.get("System", "Matrix", key, default=default)
+        values = (
+            value if isinstance(value, list) else [value] * ColorCorrection.CHANNELS
+        )
+        if len(values) != ColorCorrection.CHANNELS or not all(
+            isinstance(channel, (int, float)) and not isinstance(channel, bool)
+            for channel in values
+        ):
+            Configuration.critical_exit(
+                f"System.Matrix.{key} must be a number or a list of {ColorCorrection.CHANNELS} numbers."
+            )
+        return [float(channel) for channel in values]
+
+    @classmethod
+    def set_brightness(cls, brightness: int) -> None:
+        """
+        Applies a new brightness, to the matrix if it supports it and to the lookup table otherwise.
+
+        :param brightness: The brightness of the matrix, between 0 and 100.
+        """
+        cls.brightness = brightness
+        if cls.hardware_brightness:
+            try:
+                cls.matrix.brightness = brightness
+            except Exception as e:
+                logger.warning(
+                    f"[ColorCorrection] Failed to set the hardware brightness, applying it to the frames: {e}"
+                )
+                cls.hardware_brightness = False
+        cls.lookup_table = cls.build_lookup_table()
+        cls.version += 1
+
+    @classmethod
+    def build_lookup_table(cls) -> Optional[List[int]]:
+        """
+        Builds the lookup table of the current corrections.
+
+        :return: Optional[List[int]]: The lookup table of the three channels, None if it would not change the frames.
+        """
+        scale = 1.0 if cls.hardware_brightness else cls.brightness / 100
+        if scale == 1.0 and all(
+            value == 1.0 for value in cls.gamma + cls.color_balance
+        ):
+            return None
+
+        lookup_table: List[int] = []
+        for gamma, balance in zip(cls.gamma, cls.color_balance):
+            gain = (cls.LEVELS - 1) * balance * scale
+            lookup_table.extend(
+                round(gain * (level / (cls.LEVELS - 1)) ** gamma)
+                for level in range(cls.LEVELS)
+            )
+        return lookup_table
+
+    @classmethod
+    def apply(cls, frame: Image) -> Image:
+        """
+        Applies the corrections to a frame, without modifying it.
+
+        :param frame: The frame to correct.
+        :return: Image: The corrected frame, or the frame itself if there is nothing to correct.
+        """
+        lookup_table = cls.lookup_table
+        if lookup_table is None:
+            return frame
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        return frame.point(lookup_table)
@@ -18,18 +18,32 @@ class Configuration:
     configuration_dictionary: Dict[str, Any]
 
     @classmethod
-    def load(cls) -> None:
+    def load(cls, create_if_missing: bool = True) -> None:
         """
         Load configuration from file or create a new one from the template if it doesn't exist.
+
+        :param create_if_missing: Whether to create the first generation from the template when there is none, the template is read as is otherwise (default is True).
         """
         logger.info("[Config] Loading configuration...")
         cls.latest_generation_id = cls.get_latest_generation_id()
         cls.latest_working_generation_id = cls.get_latest_working_generation_id()
 
         if cls.latest_generation_id == 0:
+            if not create_if_missing:
+                cls.load_file(PathTo.TEMPLATE_CONFIG_FILE)
+                return
             cls.create_new_configuration_from_template()
 
-        cls.file_path = cls.get_latest_working_generation_filepath()
+        cls.load_file(cls.get_latest_working_generation_filepath())
+
+    @classmethod
+    def load_file(cls, file_path: str) -> None:
+        """
+        Load the configuration from a given file, without creating any generation.
+
+        :param file_path: The path of the configuration file.
+        """
+        cls.file_path = file_path
         try:
             with open(cls.file_path, "r") as f:
                 cls.configuration_dictionary = yaml.safe_load(f)
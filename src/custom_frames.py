@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from loguru import logger
 from PIL import Image, ImageDraw, ImageFont
 
@@ -11,13 +13,32 @@ BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 
+ERROR_DESCRIPTIONS = {
+    ServiceStatus.DISABLED: "The app is disabled.",
+    ServiceStatus.ERROR_NO_INTERNET: "No Internet connection.",
+    ServiceStatus.ERROR_SERVER: "External server error.",
+    ServiceStatus.ERROR_MODULE_CONFIG: "Module configuration error.",
+    ServiceStatus.ERROR_MODULE_INTERNAL: "Module internal error.",
+    ServiceStatus.ERROR_APP_CONFIG: "App configuration error.",
+    ServiceStatus.ERROR_APP_INTERNAL: "App internal error.",
+    ServiceStatus.ERROR_UNKNOWN: "Unknown error.",
+}
+
 
 class CustomFrames:
-    """Custom frames for the application."""
+    """Custom frames for the application, prebuilt once at initialization.
+    The frames are shared and returned without allocating, they are read-only and must be copied before drawing on them.
+    """
+
+    LOADING_STEPS: int = 100
+    LINE_HEIGHT: int = 6
 
     led_rows: int
     led_cols: int
     font = ImageFont.truetype(PathTo.FONT_FILE, FONT_SIZE)
+    black_frame: Image.Image
+    error_frames: Dict[ServiceStatus, Image.Image] = {}
+    loading_frames: List[Image.Image] = []
 
     @classmethod
     def init(cls, led_rows: int, led_cols: int) -> None:
@@ -25,74 +46,112 @@ class CustomFrames:
 
         cls.led_rows = led_rows
         cls.led_cols = led_cols
+        cls.black_frame = Image.new("RGB", (cls.led_cols, cls.led_rows), BLACK)
+        cls.error_frames = {
+            status: cls.build_error_frame(description)
+            for status, description in ERROR_DESCRIPTIONS.items()
+        }
+        cls.loading_frames = [
+            cls.build_loading_frame(percentage)
+            for percentage in range(cls.LOADING_STEPS + 1)
+        ]
         logger.debug("[CustomFrames] Custom frames initialized.")
 
     @classmethod
     def loading(cls, percentage: int) -> Image:
         """
-        Generate a loading frame with the given percentage.
+        Get the loading frame of the given percentage.
 
-        :param percentage: The loading percentage.
-        :return: Image: The loading frame.
+        :param percentage: The loading percentage, clamped between 0 and 100.
+        :return: Image: The shared loading frame, read-only.
         """
-        # TODO: Implement loading frame depending on the percentage
-        pass
+        return cls.loading_frames[max(0, min(cls.LOADING_STEPS, int(percentage)))]
 
     @classmethod
     def black(cls) -> Image:
         """
-        Generate a black screen frame.
+        Get the black screen frame.
 
-        :return: Image: The black screen frame.
+        :return: Image: The shared black screen frame, read-only.
         """
-        return Image.new("RGB", (cls.led_cols, cls.led_rows), BLACK)
+        return cls.black_frame
 
     @classmethod
     def error(cls, error_status: ServiceStatus) -> Image:
         """
-        Generate an error frame with the provided error status.
+        Get the error frame of the provided error status.
 
         :param error_status: The status of the application.
-        :return: Image: The error frame.
+        :return: Image: The shared error frame, the black frame if the status is not an error, read-only.
         """
-        # TODO: assert that this is working
-        if (
-            error_status == ServiceStatus.INITIALIZING
-            or error_status == ServiceStatus.RUNNING
-        ):
+        if error_status not in cls.error_frames:
             logger.error(
                 f"[{cls.__name__}] The app is not going under availability issue. status: {error_status.name}"
             )
-            return cls.black()
-
-        error_title = f"[{cls.__name__}]"
-        error_status_description = {
-            ServiceStatus.DISABLED: "The app is disabled.",
-            ServiceStatus.ERROR_NO_INTERNET: "No Internet connection.",
-            ServiceStatus.ERROR_SERVER: "External server error.",
-            ServiceStatus.ERROR_MODULE_CONFIG: "Module configuration error.",
-            ServiceStatus.ERROR_MODULE_INTERNAL: "Module internal error.",
-            ServiceStatus.ERROR_APP_CONFIG: "App configuration error.",
-            ServiceStatus.ERROR_APP_INTERNAL: "App internal error.",
-            ServiceStatus.ERROR_UNKNOWN: "Unknown error.",
-        }
-        error_description = error_status_description.get(
-            error_status, "Unknown error status."
-        )
-        frame = cls.black()
+            return cls.black_frame
+        return cls.error_frames[error_status]
+
+    @classmethod
+    def build_error_frame(cls, description: str) -> Image:
+        """
+        Draw an error card, with the description wrapped and centered in a red frame.
+
+        :param description: The description of the error.
+        :return: Image: The error frame.
+        """
+        frame = Image.new("RGB", (cls.led_cols, cls.led_rows), BLACK)
+        draw = ImageDraw.Draw(frame)
+        draw.rectangle((0, 0, cls.led_cols - 1, cls.led_rows - 1), outline=RED, width=1)
+        lines = ["Error"] + cls.wrap_text(description, cls.led_cols - 6)
+        top = (cls.led_rows - len(lines) * cls.LINE_HEIGHT) // 2 + 1
+        for index, line in enumerate(lines):
+            width = cls.font.getlength(line)
+            draw.text(
+                ((cls.led_cols - width) // 2, top + index * cls.LINE_HEIGHT),
+                line,
+                fill=WHITE if index == 0 else RED,
+                font=cls.font,
+            )
+        return frame
+
+    @classmethod
+    def build_loading_frame(cls, percentage: int) -> Image:
+        """
+        Draw a loading frame, with a progress bar filled to the given percentage.
+
+        :param percentage: The loading percentage.
+        :return: Image: The loading frame.
+        """
+        frame = Image.new("RGB", (cls.led_cols, cls.led_rows), BLACK)
         draw = ImageDraw.Draw(frame)
-        draw.text((5, 5), error_title, fill=RED, font=cls.font)
-        draw.text((5, 15), error_description, fill=RED, font=cls.font)
-        draw.textsize(error_description, font=cls.font)
+        text = f"Loading {percentage}%"
         draw.text(
-            (
-                cls.led_cols // 2
-                - draw.textsize(error_description, font=cls.font)[0] // 2,
-                cls.led_rows // 2,
-            ),
-            error_description,
-            fill=RED,
+            ((cls.led_cols - cls.font.getlength(text)) // 2, cls.led_rows // 2 - 7),
+            text,
+            fill=WHITE,
             font=cls.font,
         )
-        draw.rectangle((0, 0, cls.led_cols - 1, cls.led_rows - 1), outline=RED, width=1)
+        left, right = 4, cls.led_cols - 5
+        top = cls.led_rows // 2 + 2
+        draw.rectangle((left, top, right, top + 3), outline=WHITE, width=1)
+        filled = (right - left - 1) * percentage // cls.LOADING_STEPS
+        if filled > 0:
+            draw.rectangle((left + 1, top + 1, left + filled, top + 2), fill=WHITE)
         return frame
+
+    @classmethod
+    def wrap_text(cls, text: str, max_width: int) -> List[str]:
+        """
+        Split a text in lines fitting the given width, between words.
+
+        :param text: The text to wrap.
+        :param max_width: The maximum width of a line in pixels.
+        :return: List[str]: The lines.
+        """
+        lines: List[str] = []
+        for word in text.split():
+            if lines and cls.font.getlength(f"{lines[-1]} {word}") <= max_width:
+                lines[-1] = f"{lines[-1]} {word}"
+            else:
+                lines.append(word)
+        return lines
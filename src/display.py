@@ -0,0 +1,86 @@
+from typing import Any, Optional
+
+from loguru import logger
+from PIL import Image
+
+from color_correction import ColorCorrection
+
+
+class Display:
+    """Output stage presenting frames to the matrix through a double-buffered offscreen canvas."""
+
+    BLANK_FINGERPRINT: int = 0
+
+    matrix: Any
+    offscreen_canvas: Any
+    last_fingerprint: Optional[int] = None
+    last_correction_version: int = 0
+    skipped_frames: int = 0
+
+    @classmethod
+    def init(cls, matrix: Any) -> None:
+        """
+        Initializes the output stage with the offscreen canvas of the matrix.
+        The matrix owns a second canvas on screen, both are reused for the life of the process.
+
+        :param matrix: The RGBMatrix object, from 'rgbmatrix' or 'RGBMatrixEmulator'.
+        """
+        cls.matrix = matrix
+        cls.offscreen_canvas = matrix.CreateFrameCanvas()
+        cls.last_fingerprint = None
+        cls.skipped_frames = 0
+        logger.debug("[Display] Offscreen canvas created.")
+
+    @classmethod
+    def present(cls, frame: Image, apply_correction: bool = True) -> bool:
+        """
+        Draws the frame on the offscreen canvas and swaps it on screen at the next vertical sync.
+        The frame is skipped when it is identical to the one already on screen and the colour correction did not change.
+
+        :param frame: The RGB frame to display.
+        :param apply_correction: Whether the colour correction is applied, False for frames already corrected (default is True).
+        :return: bool: True if the frame was pushed to the matrix, False if it was skipped.
+        """
+        fingerprint = cls.fingerprint(frame)
+        correction_version = ColorCorrection.version
+        if (
+            fingerprint == cls.last_fingerprint
+            and correction_version == cls.last_correction_version
+        ):
+            cls.skipped_frames += 1
+            return False
+
+        cls.offscreen_canvas.SetImage(
+            ColorCorrection.apply(frame) if apply_correction else frame
+        )
+        cls.offscreen_canvas = cls.matrix.SwapOnVSync(cls.offscreen_canvas)
+        cls.last_fingerprint = fingerprint
+        cls.last_correction_version = correction_version
+        return True
+
+    @classmethod
+    def clear(cls) -> bool:
+        """
+        Blanks the display without allocating a black frame.
+        Nothing is pushed to the matrix when the display is already blank.
+
+        :return: bool: True if the display was cleared, False if it was already blank.
+        """
+        if cls.last_fingerprint == cls.BLANK_FINGERPRINT:
+            cls.skipped_frames += 1
+            return False
+
+        cls.offscreen_canvas.Clear()
+        cls.offscreen_canvas = cls.matrix.SwapOnVSync(cls.offscreen_canvas)
+        cls.last_fingerprint = cls.BLANK_FINGERPRINT
+        return True
+
+    @staticmethod
+    def fingerprint(frame: Image) -> int:
+        """
+        Computes a cheap fingerprint of the frame from its size and raw bytes.
+
+        :param frame: The frame to fingerprint.
+        :return: int: The fingerprint of the frame, never equal to BLANK_FINGERPRINT.
+        """
+        return hash((frame.size, frame.tobytes())) or 1
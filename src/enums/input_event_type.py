@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class InputEventType(Enum):
+    """
+    Enum to represent the type of an event of the input bus.
+
+    Attributes:
+        ROTATION (int): A detent of the encoder, the value is 1 clockwise and -1 counter-clockwise.
+        GESTURE (int): A gesture of the encoder button, the value is an EncoderInput.
+        TILT (int): A change of orientation, the value is a TiltState.
+        REFRESH (int): New data to show for an application, the value is the name of the application.
+    """
+
+    ROTATION = 1
+    GESTURE = 2
+    TILT = 3
+    REFRESH = 4
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class MatrixBackend(Enum):
+    """
+    Enum to represent the backend driving the frames of the matrix.
+
+    Attributes:
+        HARDWARE (int): The LED matrix, through the 'rpi-rgb-led-matrix' library.
+        EMULATOR (int): The emulated matrix, through the 'RGBMatrixEmulator' library.
+        NULL (int): A matrix discarding all frames, to run headless.
+    """
+
+    HARDWARE = 1
+    EMULATOR = 2
+    NULL = 3
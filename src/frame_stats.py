@@ -0,0 +1,213 @@
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from path import PathTo
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of durations, with logarithmic buckets from 10 µs to 10 s."""
+
+    MIN_VALUE: float = 1e-5
+    DECADES: int = 6
+    BUCKETS_PER_DECADE: int = 20
+
+    def __init__(self):
+        # First bucket for values under MIN_VALUE, last bucket for values over the range
+        self.counts: List[int] = [0] * (self.DECADES * self.BUCKETS_PER_DECADE + 2)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Adds a duration to the histogram.
+
+        :param value: The duration in seconds.
+        """
+        if value < self.MIN_VALUE:
+            index = 0
+        else:
+            index = min(
+                len(self.counts) - 1,
+                1 + int(math.log10(value / self.MIN_VALUE) * self.BUCKETS_PER_DECADE),
+            )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def bucket_upper_bound(self, index: int) -> float:
+        """
+        Returns the upper bound of a bucket.
+
+        :param index: The index of the bucket.
+        :return: float: The upper bound in seconds.
+        """
+        if index >= len(self.counts) - 1:
+            return self.max
+        return self.MIN_VALUE * 10 ** (index / self.BUCKETS_PER_DECADE)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns an estimate of the given percentile, precise to the width of a bucket.
+
+        :param percentile: The percentile, between 0 and 100.
+        :return: float: The duration in seconds, 0 if the histogram is empty.
+        """
+        if self.count == 0:
+            return 0.0
+        threshold = math.ceil(self.count * percentile / 100)
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= threshold:
+                return min(self.bucket_upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns the count, mean, p50, p95, p99 and max of the histogram, durations in milliseconds.
+
+        :return: Dict[str, float]: The summary of the histogram.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class FrameStats:
+    """Per application frame time instrumentation of the main loop."""
+
+    RENDER: str = "render"
+    PRESENT: str = "present"
+    INTERVAL: str = "interval"
+    METRICS: List[str] = [RENDER, PRESENT, INTERVAL]
+
+    histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+    missed_deadlines: Dict[str, int] = {}
+    last_tick: Optional[float] = None
+    lock: threading.Lock = threading.Lock()
+    # Set from a signal handler, which must not take the lock held by the main loop
+    summary_requested: bool = False
+
+    @classmethod
+    def record(cls, app_name: str, metric: str, duration: float) -> None:
+        """
+        Records a duration for an application.
+
+        :param app_name: The name of the application the duration is attributed to.
+        :param metric: The metric, one of METRICS.
+        :param duration: The duration in seconds.
+        """
+        with cls.lock:
+            if app_name not in cls.histograms:
+                cls.histograms[app_name] = {
+                    name: LatencyHistogram() for name in cls.METRICS
+                }
+                cls.missed_deadlines[app_name] = 0
+            cls.histograms[app_name][metric].record(duration)
+
+    @classmethod
+    def record_missed_deadline(cls, app_name: str) -> None:
+        """
+        Counts a missed frame deadline for an application.
+
+        :param app_name: The name of the application on screen.
+        """
+        with cls.lock:
+            cls.missed_deadlines[app_name] = cls.missed_deadlines.get(app_name, 0) + 1
+
+    @classmethod
+    def tick(cls, app_name: str) -> None:
+        """
+        Records the interval since the previous frame presented.
+
+        :param app_name: The name of the application on screen.
+        """
+        now = time.monotonic()
+        if cls.last_tick is not None:
+            cls.record(app_name, cls.INTERVAL, now - cls.last_tick)
+        cls.last_tick = now
+
+    @classmethod
+    def reset_tick(cls) -> None:
+        """
+        Forgets the previous frame, so a pause of the loop is not recorded as a frame interval.
+        """
+        cls.last_tick = None
+
+    @classmethod
+    def get_summary(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the statistics of each application.
+
+        :return: Dict[str, Dict[str, Any]]: The summary of each metric and the missed deadlines, by application name.
+        """
+        with cls.lock:
+            return {
+                app_name: {
+                    **{
+                        metric: histogram.summary()
+                        for metric, histogram in histograms.items()
+                    },
+                    "missed_deadlines": cls.missed_deadlines.get(app_name, 0),
+                }
+                for app_name, histograms in cls.histograms.items()
+            }
+
+    @classmethod
+    def request_summary(cls) -> None:
+        """
+        Asks for the statistics to be logged by the main loop, safe to call from a signal handler.
+        """
+        cls.summary_requested = True
+
+    @classmethod
+    def log_requested_summary(cls) -> None:
+        """
+        Logs the statistics of each application if they were requested since the last call.
+        """
+        if cls.summary_requested:
+            cls.summary_requested = False
+            cls.log_summary()
+
+    @classmethod
+    def log_summary(cls) -> None:
+        """
+        Logs the statistics of each application.
+        """
+        for app_name, summary in cls.get_summary().items():
+            for metric in cls.METRICS:
+                stats = summary[metric]
+                logger.info(
+                    f"[FrameStats] {app_name} {metric}: {stats['count']} frames, "
+                    f"p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, "
+                    f"p99 {stats['p99_ms']}ms, max {stats['max_ms']}ms."
+                )
+            logger.info(
+                f"[FrameStats] {app_name}: {summary['missed_deadlines']} missed deadlines."
+            )
+
+    @classmethod
+    def dump(cls) -> None:
+        """
+        Writes the statistics of each application to the frame stats file.
+        """
+        try:
+            os.makedirs(PathTo.LOGS_FOLDER, exist_ok=True)
+            with open(PathTo.FRAME_STATS_FILE, "w") as f:
+                json.dump(cls.get_summary(), f, indent=2)
+            logger.info(f"[FrameStats] Statistics saved to {PathTo.FRAME_STATS_FILE}")
+        except Exception as e:
+            logger.error(f"[FrameStats] Failed to save statistics: {e}")
@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+from enums.encoder_input import EncoderInput
+
+
+class GestureRecognizer:
+    """Recognizes the gestures of a button from its press and release edges, with timers instead of polling."""
+
+    HOLD_TIME: float = 1.0
+    MULTI_PRESS_TIME: float = 0.3
+    MAX_PRESSES: int = 3
+    PRESS_GESTURES = {
+        1: EncoderInput.SINGLE_PRESS,
+        2: EncoderInput.DOUBLE_PRESS,
+        3: EncoderInput.TRIPLE_PRESS,
+    }
+
+    def __init__(
+        self,
+        on_gesture: Callable[[EncoderInput], None],
+        hold_time: float = HOLD_TIME,
+        multi_press_time: float = MULTI_PRESS_TIME,
+    ):
+        """
+        Initialize the recognizer, idle.
+
+        :param on_gesture: Callable[[EncoderInput], None]: Called with each recognized gesture, from the thread of the edge or of the timer.
+        :param hold_time: float: The time the button is held for a long press, in seconds.
+        :param multi_press_time: float: The maximum time between a release and the next press of a double or triple press, in seconds.
+        """
+        self.on_gesture = on_gesture
+        self.hold_time = hold_time
+        self.multi_press_time = multi_press_time
+        self.lock = threading.Lock()
+        self.timer: Optional[threading.Timer] = None
+        # Incremented on each edge, so a timer started before the edge does nothing
+        self.sequence = 0
+        self.press_count = 0
+        self.press_time = 0.0
+        self.is_pressed = False
+        self.is_long_press = False
+
+    def press(self) -> None:
+        """
+        Feeds a press edge of the button.
+        """
+        with self.lock:
+            self.sequence += 1
+            self.cancel_timer()
+            self.is_pressed = True
+            self.is_long_press = False
+            self.press_count += 1
+            self.press_time = time.monotonic()
+            self.start_timer(self.hold_time, self.on_hold_timeout)
+
+    def release(self) -> None:
+        """
+        Feeds a release edge of the button.
+        """
+        with self.lock:
+            if not self.is_pressed:
+                return
+            self.sequence += 1
+            self.cancel_timer()
+            self.is_pressed = False
+
+            if self.is_long_press:
+                self.is_long_press = False
+                return
+            if time.monotonic() - self.press_time >= self.hold_time:
+                gesture = EncoderInput.LONG_PRESS
+            elif self.press_count >= self.MAX_PRESSES:
+                gesture = self.PRESS_GESTURES[self.MAX_PRESSES]
+            else:
+                self.start_timer(self.multi_press_time, self.on_multi_press_timeout)
+                return
+            self.press_count = 0
+        self.emit(gesture)
+
+    def on_hold_timeout(self, sequence: int) -> None:
+        """
+        Recognizes a long press once the button has been held for the hold time.
+
+        :param sequence: int: The edge sequence number when the timer was started.
+        """
+        with self.lock:
+            if sequence != self.sequence or not self.is_pressed:
+                return
+            self.is_long_press = True
+            self.press_count = 0
+        self.emit(EncoderInput.LONG_PRESS)
+
+    def on_multi_press_timeout(self, sequence: int) -> None:
+        """
+        Recognizes a single or double press once no press followed the last release.
+
+        :param sequence: int: The edge sequence number when the timer was started.
+        """
+        with self.lock:
+            if sequence != self.sequence or self.is_pressed:
+                return
+            gesture = self.PRESS_GESTURES[self.press_count]
+            self.press_count = 0
+        self.emit(gesture)
+
+    def start_timer(self, interval: float, callback: Callable[[int], None]) -> None:
+        """
+        Starts the timer of the current state, the lock must be held.
+
+        :param interval: float: The time before the callback is called, in seconds.
+        :param callback: Callable[[int], None]: Called with the current edge sequence number.
+        """
+        self.timer = threading.Timer(interval, callback, args=(self.sequence,))
+        self.timer.daemon = True
+        self.timer.start()
+
+    def cancel_timer(self) -> None:
+        """
+        Cancels the timer of the current state, the lock must be held.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def emit(self, gesture: EncoderInput) -> None:
+        """
+        Reports a recognized gesture, outside of the lock.
+
+        :param gesture: EncoderInput: The recognized gesture.
+        """
+        logger.debug(f"[GestureRecognizer] {gesture.name.lower()} detected.")
+        self.on_gesture(gesture)
+
+    def reset(self) -> None:
+        """
+        Cancels the gesture in progress.
+        """
+        with self.lock:
+            self.sequence += 1
+            self.cancel_timer()
+            self.press_count = 0
+            self.is_pressed = False
+            self.is_long_press = False
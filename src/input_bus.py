@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from loguru import logger
+
+from enums.input_event_type import InputEventType
+from models.input_event import InputEvent
+
+
+class InputBus:
+    """Carries the timestamped input events from the input callbacks to the render stage, waking the main loop up on each event."""
+
+    # Oldest events are dropped past this number, if the render stage stops draining the bus
+    MAX_PENDING_EVENTS: int = 256
+
+    condition: threading.Condition = threading.Condition()
+    pending_events: Deque[InputEvent] = deque(maxlen=MAX_PENDING_EVENTS)
+    # Incremented on each event, for the waiters to know if an event was published
+    sequence: int = 0
+    listeners: List[Callable[[InputEvent], None]] = []
+    subscriptions: List[
+        Tuple[Any, Optional[InputEventType], Callable[[InputEvent], None]]
+    ] = []
+
+    @classmethod
+    def publish(cls, event_type: InputEventType, value: Any) -> InputEvent:
+        """
+        Publishes an input event, notifies the listeners and wakes the waiters up, from the thread of the input callback.
+        The listeners are called under the lock of the bus, so they must not block.
+
+        :param event_type: The type of the event.
+        :param value: The value of the event, depending on its type.
+        :return: InputEvent: The published event.
+        """
+        event = InputEvent(event_type, value, time.monotonic())
+        with cls.condition:
+            for listener in cls.listeners:
+                listener(event)
+            cls.pending_events.append(event)
+            cls.sequence += 1
+            cls.condition.notify_all()
+        return event
+
+    @classmethod
+    def wait(cls, timeout: Optional[float], sequence: int) -> int:
+        """
+        Waits for an event published after the given sequence number, or for the timeout.
+
+        :param timeout: The maximum time to wait in seconds, None to wait for an event.
+        :param sequence: The sequence number of the last event seen by the caller.
+        :return: int: The sequence number of the last event published.
+        """
+        with cls.condition:
+            cls.condition.wait_for(lambda: cls.sequence != sequence, timeout)
+            return cls.sequence
+
+    @classmethod
+    def drain(cls) -> List[InputEvent]:
+        """
+        Removes and returns the pending events, to be called by the render stage once per frame.
+
+        :return: List[InputEvent]: The pending events, oldest first.
+        """
+        with cls.condition:
+            events = list(cls.pending_events)
+            cls.pending_events.clear()
+        return events
+
+    @classmethod
+    def subscribe(
+        cls,
+        owner: Any,
+        handler: Callable[[InputEvent], None],
+        event_type: Optional[InputEventType] = None,
+    ) -> None:
+        """
+        Subscribes a handler of an application to the input events, delivered while the application is on screen.
+
+        :param owner: The application owning the handler.
+        :param handler: Called with each event, on the render stage before the frame of the application is generated.
+        :param event_type: The type of the events to deliver, all types if None (default is None).
+        """
+        cls.subscriptions.append((owner, event_type, handler))
+
+    @classmethod
+    def unsubscribe(cls, owner: Any) -> None:
+        """
+        Removes the handlers of an application.
+
+        :param owner: The application owning the handlers.
+        """
+        cls.subscriptions = [
+            subscription
+            for subscription in cls.subscriptions
+            if subscription[0] is not owner
+        ]
+
+    @classmethod
+    def dispatch(cls, owner: Any, events: List[InputEvent]) -> None:
+        """
+        Delivers events to the handlers of an application.
+
+        :param owner: The application on screen.
+        :param events: The events to deliver, oldest first.
+        """
+        handlers = [
+            (event_type, handler)
+            for subscriber, event_type, handler in cls.subscriptions
+            if subscriber is owner
+        ]
+        if not handlers:
+            return
+        for event in events:
+            for event_type, handler in handlers:
+                if event_type is None or event_type is event.type:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        logger.error(
+                            f"[InputBus] Error handling {event.type.name.lower()} event: {e}"
+                        )
@@ -8,6 +8,10 @@ from path import PathTo
 
 
 class Logs:
+    # Levels of the logger created, for the worker processes to create the same
+    file_level: str = "DEBUG"
+    console_level: str = "WARNING"
+
     @classmethod
     def start(cls, file_level: str = "DEBUG", console_level: str = "WARNING") -> None:
         """
@@ -40,6 +44,8 @@ class Logs:
             :param file_level: The log level for file logging (default is "DEBUG").
             :param console_level: The log level for console logging (default is "WARNING").
         """
+        cls.file_level = file_level
+        cls.console_level = console_level
         # Remove default handler
         logger.remove()
 
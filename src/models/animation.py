@@ -0,0 +1,158 @@
+"""Animation model classes."""
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from PIL import Image, ImageSequence
+
+
+class Animation:
+    """Animation decoded once into RGB frames at the resolution of the matrix, stored back to back in one buffer."""
+
+    DEFAULT_FRAME_DURATION: int = 100
+
+    def __init__(self, size: Tuple[int, int], frames: bytes, durations: List[int]):
+        """
+        Wrap the decoded frames of an animation.
+
+        :param size: Tuple[int, int]: The width and height of the frames.
+        :param frames: bytes: The RGB pixels of all the frames, one after the other.
+        :param durations: List[int]: The duration of each frame in milliseconds.
+        """
+        self.size = size
+        self.frames = frames
+        self.durations = durations
+        self.frame_count = len(durations)
+        self.frame_size = size[0] * size[1] * 3
+        # Time from the start of the animation at which each frame ends, in milliseconds
+        self.frame_ends = list(accumulate(durations))
+        self.duration = self.frame_ends[-1] if durations else 0
+
+    @classmethod
+    def decode(cls, path: str, size: Tuple[int, int]) -> "Animation":
+        """
+        Decode all the frames of an animated image, scaling them to the given size when needed.
+
+        :param path: str: The path of the animated image.
+        :param size: Tuple[int, int]: The width and height of the matrix.
+        :return: Animation: The decoded animation.
+        """
+        frames = bytearray()
+        durations = []
+        with Image.open(path) as image:
+            for frame in ImageSequence.Iterator(image):
+                duration = frame.info.get("duration") or cls.DEFAULT_FRAME_DURATION
+                frame = frame.convert("RGB")
+                if frame.size != size:
+                    frame = frame.resize(size, Image.Resampling.NEAREST)
+                frames += frame.tobytes()
+                durations.append(int(duration))
+        return cls(size, bytes(frames), durations)
+
+    @property
+    def byte_size(self) -> int:
+        """
+        The memory used by the frames of the animation.
+        """
+        return len(self.frames)
+
+    def get_frame_index(self, position: float) -> int:
+        """
+        Get the frame shown at a position of the animation.
+
+        :param position: float: The time from the start of the animation in milliseconds, less than its duration.
+        :return: int: The index of the frame.
+        """
+        return min(bisect_right(self.frame_ends, position), self.frame_count - 1)
+
+    def get_frame(self, index: int) -> Image.Image:
+        """
+        Build a new image of a frame, which can be drawn on.
+
+        :param index: int: The index of the frame.
+        :return: Image.Image: The RGB frame.
+        """
+        start = index * self.frame_size
+        return Image.frombytes(
+            "RGB", self.size, self.frames[start : start + self.frame_size]
+        )
+
+
+class AnimationCache:
+    """Least recently used animations kept decoded within a budget of bytes, safe to use from several threads."""
+
+    def __init__(self, budget: int):
+        """
+        Create an empty cache.
+
+        :param budget: int: The number of bytes the decoded frames can use.
+        """
+        self.budget = budget
+        self.animations: OrderedDict[str, Animation] = OrderedDict()
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def __contains__(self, path: str) -> bool:
+        with self.lock:
+            return path in self.animations
+
+    def get(self, path: str) -> Optional[Animation]:
+        """
+        Get an animation if it is decoded, marking it as the most recently used.
+
+        :param path: str: The path of the animated image.
+        :return: Optional[Animation]: The decoded animation, None if it is not in the cache.
+        """
+        with self.lock:
+            animation = self.animations.get(path)
+            if animation is not None:
+                self.animations.move_to_end(path)
+            return animation
+
+    def put(self, path: str, animation: Animation) -> None:
+        """
+        Add an animation as the most recently used, evicting the least recently used ones above the budget.
+        The animation is kept even if it is larger than the budget on its own.
+
+        :param path: str: The path of the animated image.
+        :param animation: Animation: The decoded animation.
+        """
+        with self.lock:
+            previous = self.animations.pop(path, None)
+            if previous is not None:
+                self.used -= previous.byte_size
+            self.animations[path] = animation
+            self.used += animation.byte_size
+            while self.used > self.budget and len(self.animations) > 1:
+                evicted_path, evicted = self.animations.popitem(last=False)
+                self.used -= evicted.byte_size
+                logger.debug(f"[AnimationCache] Evicted {evicted_path}.")
+
+    def clear(self) -> None:
+        """
+        Drop all the decoded animations.
+        """
+        with self.lock:
+            self.animations.clear()
+            self.used = 0
+
+    def load(self, path: str, size: Tuple[int, int]) -> Animation:
+        """
+        Get an animation, decoding it first if it is not in the cache.
+
+        :param path: str: The path of the animated image.
+        :param size: Tuple[int, int]: The width and height of the matrix.
+        :return: Animation: The decoded animation.
+        """
+        animation = self.get(path)
+        if animation is None:
+            animation = Animation.decode(path, size)
+            self.put(path, animation)
+            logger.debug(
+                f"[AnimationCache] Decoded {path}: {animation.frame_count} frames, {animation.byte_size // 1024}KB."
+            )
+        return animation
@@ -1,6 +1,6 @@
 """App model class."""
 
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 
 from loguru import logger
 from PIL import Image
@@ -8,8 +8,10 @@ from PIL import Image
 from config import Configuration
 from custom_frames import CustomFrames
 from enums.encoder_input import EncoderInput
+from enums.input_event_type import InputEventType
 from enums.service_status import ServiceStatus
 from enums.tilt_input import TiltState
+from input_bus import InputBus
 
 
 class Application:
@@ -42,6 +44,9 @@ class Application:
         self.vertical_replacement_app_name = Configuration.get_from_app_config(
             self.__class__.__name__, "vertical_replacement_app"
         )
+        self.render_in_process: bool = Configuration.get_from_app_config(
+            self.__class__.__name__, "render_in_process", default=False
+        )
 
         if not self.enabled:
             self.status = ServiceStatus.DISABLED
@@ -50,6 +55,7 @@ class Application:
         """
         Generate the frame for the app.
         This method should be extended by subclasses to implement specific frame generation logic.
+        The replacement apps of the tilt states are resolved by the AppManager routes, before the app is asked for a frame.
 
         :param tilt_state: TiltState: The current tilt state of the device.
         :param encoder_input: EncoderInput: The status of the encoder input.
@@ -58,23 +64,21 @@ class Application:
         if self.status != ServiceStatus.RUNNING:
             return self.generate_on_error()
 
-        if tilt_state is TiltState.HORIZONTAL and not self.provides_horizontal_content:
-            replacement_app: Application = self.callbacks["get_app_by_name"](
-                self.horizontal_replacement_app_name
-            )
-            if replacement_app:
-                return replacement_app.generate(tilt_state, encoder_input)
-            else:
-                return CustomFrames.black()
-
-        if tilt_state is TiltState.VERTICAL and not self.provides_vertical_content:
-            replacement_app: Application = self.callbacks["get_app_by_name"](
-                self.vertical_replacement_app_name
-            )
-            if replacement_app:
-                return replacement_app.generate(tilt_state, encoder_input)
-            else:
-                return CustomFrames.black()
+    def get_frame_lifetime(self) -> Optional[float]:
+        """
+        Get how long the last frame generated stays valid, so the main loop sleeps until it changes instead of generating it again every frame.
+        This method can be extended by subclasses, by default the frame is generated again every frame.
+
+        :return: Optional[float]: The number of seconds the frame stays valid, math.inf until the next input or refresh request, None to generate it again every frame.
+        """
+        return None
+
+    def request_refresh(self) -> None:
+        """
+        Ask for a new frame when the data shown by the app changed, ending the validity of its last frame.
+        Can be called from any thread.
+        """
+        InputBus.publish(InputEventType.REFRESH, self.name)
 
     def generate_on_error(self) -> Image:
         """
@@ -83,3 +87,34 @@ class Application:
         :return: Image: The error frame.
         """
         return CustomFrames.error(self.status)
+
+    def on_enter(self) -> None:
+        """
+        Called when the app is shown, after a switch in the carousel or a change of tilt state.
+        This method can be extended by subclasses, it does nothing by default.
+        """
+
+    def on_exit(self) -> None:
+        """
+        Called when the app is hidden, after a switch in the carousel, a change of tilt state or before the display is turned off.
+        This method can be extended by subclasses, it does nothing by default.
+        """
+
+    def suspend(self) -> None:
+        """
+        Called when the display is turned off, on every built app, and before a lazy app is evicted, to pause background work and free resources.
+        This method can be extended by subclasses, it does nothing by default.
+        """
+
+    def resume(self) -> None:
+        """
+        Called when the display is turned on again, on every app suspended, before the app shown gets on_enter.
+        This method can be extended by subclasses, it does nothing by default.
+        """
+
+    def warm(self) -> None:
+        """
+        Called on the previous and next apps of the carousel while the loop is idle, to prepare their first frame.
+        It must neither draw a frame, change the state shown nor block, as it runs with the rendering stopped.
+        This method can be extended by subclasses, it does nothing by default.
+        """
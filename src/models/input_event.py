@@ -0,0 +1,14 @@
+"""Input event model class."""
+
+from typing import Any, NamedTuple
+
+from enums.input_event_type import InputEventType
+
+
+class InputEvent(NamedTuple):
+    """Event published on the input bus by the input callbacks."""
+
+    type: InputEventType
+    value: Any
+    # Time of the input, from time.monotonic()
+    timestamp: float
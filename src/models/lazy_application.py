@@ -0,0 +1,158 @@
+"""Lazy application model class."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+from PIL import Image
+
+from config import Configuration
+from enums.encoder_input import EncoderInput
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
+from input_bus import InputBus
+from models.application import Application
+from registry import Registry
+
+
+class LazyApplication:
+    """Stands in for an application until it is first shown, with the metadata read from the configuration at boot.
+    The application is built on first use and can be evicted after being hidden for a while.
+    """
+
+    def __init__(self, app_name: str, callbacks: Dict[str, Callable]):
+        """
+        Read the metadata of the application, without importing nor building it.
+
+        :param app_name: str: The name of the application in the configuration and the registry.
+        :param callbacks: Dict[str, Callable]: The callbacks given to the application when built.
+        """
+        self.app_name = app_name
+        self.callbacks = callbacks
+        self.app: Optional[Application] = None
+        self.last_used: float = 0
+        self.lock = threading.Lock()
+
+        self.enabled: bool = Configuration.get_from_app(
+            app_name, "enabled", required=True
+        )
+        self.name: str = Configuration.get_from_app_meta(
+            app_name, "name", required=True
+        )
+        self.description: str = Configuration.get_from_app_meta(
+            app_name, "description", required=True
+        )
+        self.provides_horizontal_content: bool = Configuration.get_from_app_meta(
+            app_name, "provides_horizontal_content", required=True
+        )
+        self.provides_vertical_content: bool = Configuration.get_from_app_meta(
+            app_name, "provides_vertical_content", required=True
+        )
+        self.horizontal_replacement_app_name: Optional[str] = (
+            Configuration.get_from_app_config(app_name, "horizontal_replacement_app")
+        )
+        self.vertical_replacement_app_name: Optional[str] = (
+            Configuration.get_from_app_config(app_name, "vertical_replacement_app")
+        )
+        self.render_in_process: bool = Configuration.get_from_app_config(
+            app_name, "render_in_process", default=False
+        )
+        self.lazy_load: bool = Configuration.get_from_app_config(
+            app_name, "lazy_load", default=False
+        )
+        self.idle_eviction_in_seconds: float = Configuration.get_from_app_config(
+            app_name, "idle_eviction_in_seconds", default=0
+        )
+        if (
+            not isinstance(self.idle_eviction_in_seconds, (int, float))
+            or self.idle_eviction_in_seconds < 0
+        ):
+            Configuration.critical_exit(
+                f"Apps.{app_name}.config.idle_eviction_in_seconds must be a number of seconds, 0 to never evict the app."
+            )
+
+    @property
+    def status(self) -> ServiceStatus:
+        """
+        The status of the application, initializing until it is built.
+        """
+        if not self.enabled:
+            return ServiceStatus.DISABLED
+        if self.app is None:
+            return ServiceStatus.INITIALIZING
+        return self.app.status
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def is_loaded(self) -> bool:
+        """
+        Check if the application is built.
+
+        :return: bool: True if the application is built, False otherwise.
+        """
+        return self.app is not None
+
+    def load(self, mark_as_used: bool = True) -> Application:
+        """
+        Build the application if needed and mark it as used.
+
+        :param mark_as_used: bool: Whether the use delays the eviction of the application (default is True).
+        :return: Application: The application.
+        """
+        with self.lock:
+            if self.app is None:
+                start_time = time.perf_counter()
+                self.app = Registry.get_app_class(self.app_name)(self.callbacks)
+                logger.info(
+                    f"[{self.app_name}] Loaded in {(time.perf_counter() - start_time) * 1000:.0f}ms."
+                )
+            if mark_as_used:
+                self.last_used = time.monotonic()
+            return self.app
+
+    def warm(self) -> None:
+        """
+        Build the application if needed and warm it up, without marking it as used, so it stays evictable once no longer a neighbour.
+        """
+        self.load(mark_as_used=False).warm()
+
+    def unload(self) -> None:
+        """
+        Suspend the application and drop it with its input handlers, so its resources are freed until it is used again.
+        The application is hidden, so it already got on_exit.
+        """
+        with self.lock:
+            if self.app is None:
+                return
+            try:
+                self.app.suspend()
+            except Exception as e:
+                logger.error(f"[{self.app_name}] Error in suspend before eviction: {e}")
+            InputBus.unsubscribe(self.app)
+            self.app = None
+        logger.info(f"[{self.app_name}] Evicted after being idle.")
+
+    def is_idle(self, now: float) -> bool:
+        """
+        Check if the application is built and was not used for its idle eviction delay.
+
+        :param now: The current monotonic time in seconds.
+        :return: bool: True if the application can be evicted, False otherwise.
+        """
+        return (
+            self.app is not None
+            and self.idle_eviction_in_seconds > 0
+            and now - self.last_used >= self.idle_eviction_in_seconds
+        )
+
+    def generate(self, tilt_state: TiltState, encoder_input: EncoderInput) -> Image:
+        """
+        Build the application if needed and generate its frame.
+
+        :param tilt_state: TiltState: The current tilt state of the device.
+        :param encoder_input: EncoderInput: The status of the encoder input.
+        :return: Image: The generated frame.
+        """
+        return self.load().generate(tilt_state, encoder_input)
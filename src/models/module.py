@@ -28,3 +28,15 @@ class Module:
         raise NotImplementedError(
             f"[{self.__class__.__name__}] self_test method not implemented. Please implement this method logic in the subclass."
         )
+
+    def suspend(self) -> None:
+        """
+        Called when the display is turned off, to pause polling until resumed.
+        This method can be extended by subclasses, it does nothing by default.
+        """
+
+    def resume(self) -> None:
+        """
+        Called when the display is turned on again.
+        This method can be extended by subclasses, it does nothing by default.
+        """
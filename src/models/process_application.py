@@ -0,0 +1,319 @@
+"""Process application model class."""
+
+import multiprocessing
+import signal
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from loguru import logger
+from PIL import Image
+
+from board import Board
+from config import Configuration
+from custom_frames import CustomFrames
+from enums.encoder_input import EncoderInput
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
+from input_bus import InputBus
+from logs import Logs
+from models.application import Application
+
+# Callbacks acting on the main process, replayed there after each frame
+FORWARDED_CALLBACKS = [
+    "toggle_display",
+    "switch_next_app",
+    "switch_prev_app",
+    "increase_brightness",
+    "decrease_brightness",
+]
+
+# Spawned rather than forked, so the workers do not inherit the threads of the GPIO, the splash or the logger with a lock held
+WORKER_CONTEXT = multiprocessing.get_context("spawn")
+
+
+class ProcessApplication:
+    """Wraps an application to run its frame generation in a worker process, frames come back through a shared memory ring of RGB buffers."""
+
+    RING_SLOTS: int = 10
+    RESPONSE_TIMEOUT: float = 1.0
+    STARTUP_TIMEOUT: float = 30.0
+
+    def __init__(self, app: Application):
+        """
+        Start the worker process of the application, spawned with the application built again in it.
+
+        :param app: Application: The application to run in a worker process.
+        """
+        self.app = app
+        self.frame_size = (Board.led_cols, Board.led_rows)
+        self.slot_size = Board.led_cols * Board.led_rows * 3
+        self.shared_memory = SharedMemory(
+            create=True, size=self.RING_SLOTS * self.slot_size
+        )
+        self.sequence = 0
+        self.last_frame: Optional[Image.Image] = None
+        self.last_frame_lifetime: Optional[float] = None
+
+        self.connection, worker_connection = WORKER_CONTEXT.Pipe()
+        self.process = WORKER_CONTEXT.Process(
+            target=self.run_worker,
+            args=(
+                app.__class__,
+                app.callbacks,
+                self.shared_memory,
+                worker_connection,
+                Configuration.file_path,
+                Logs.file_level,
+                Logs.console_level,
+            ),
+            name=f"{app.__class__.__name__}Renderer",
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+        # The worker imports the modules, reads the configuration and builds the application before its first frame
+        if not self.connection.poll(self.STARTUP_TIMEOUT):
+            logger.warning(
+                f"[{app.__class__.__name__}] Worker process {self.process.pid} not ready in time."
+            )
+            return
+        try:
+            self.connection.recv()
+        except EOFError:
+            logger.error(f"[{app.__class__.__name__}] Worker process failed to start.")
+            return
+        logger.info(
+            f"[{app.__class__.__name__}] Rendering in worker process {self.process.pid}."
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.app, name)
+
+    def generate(self, tilt_state: TiltState, encoder_input: EncoderInput) -> Image:
+        """
+        Forward the inputs to the worker process and return the frame it wrote in the shared memory ring.
+        The input events of the frame are delivered to the handlers the application subscribed in the worker process.
+        The callbacks called by the application in the worker process are replayed in the main process.
+
+        :param tilt_state: TiltState: The current tilt state of the device.
+        :param encoder_input: EncoderInput: The status of the encoder input.
+        :return: Image: The generated frame, backed by the shared memory ring.
+        """
+        self.sequence += 1
+        self.last_frame_lifetime = None
+        try:
+            self.connection.send(
+                (
+                    self.sequence,
+                    tilt_state.value,
+                    encoder_input.value,
+                    Board.get_encoder_steps(),
+                    Board.get_encoder_steps(accelerated=True),
+                    Board.input_events,
+                )
+            )
+            while True:
+                if not self.connection.poll(self.RESPONSE_TIMEOUT):
+                    logger.warning(
+                        f"[{self.app.__class__.__name__}] Worker process did not answer in time, showing the last frame."
+                    )
+                    return self.last_frame or CustomFrames.black()
+                sequence, slot, called_callbacks, frame_lifetime = (
+                    self.connection.recv()
+                )
+                if sequence == self.sequence:
+                    break
+        except (EOFError, OSError) as e:
+            logger.error(f"[{self.app.__class__.__name__}] Worker process lost: {e}")
+            return CustomFrames.error(ServiceStatus.ERROR_APP_INTERNAL)
+
+        for callback_name in called_callbacks:
+            self.app.callbacks[callback_name]()
+
+        self.last_frame_lifetime = frame_lifetime
+        if slot is None:
+            return CustomFrames.error(ServiceStatus.ERROR_APP_INTERNAL)
+
+        offset = slot * self.slot_size
+        self.last_frame = Image.frombuffer(
+            "RGB",
+            self.frame_size,
+            self.shared_memory.buf[offset : offset + self.slot_size],
+            "raw",
+            "RGB",
+            0,
+            1,
+        )
+        return self.last_frame
+
+    def get_frame_lifetime(self) -> Optional[float]:
+        """
+        Get how long the last frame generated in the worker process stays valid.
+
+        :return: Optional[float]: The number of seconds the frame stays valid, math.inf until the next input or refresh request, None to generate it again every frame.
+        """
+        return self.last_frame_lifetime
+
+    def on_enter(self) -> None:
+        """
+        Forward the notification that the application is shown to the worker process.
+        """
+        self.forward_hook("on_enter")
+
+    def on_exit(self) -> None:
+        """
+        Forward the notification that the application is hidden to the worker process.
+        """
+        self.forward_hook("on_exit")
+
+    def suspend(self) -> None:
+        """
+        Forward the notification that the display is off to the worker process.
+        """
+        self.forward_hook("suspend")
+
+    def resume(self) -> None:
+        """
+        Forward the notification that the display is on again to the worker process.
+        """
+        self.forward_hook("resume")
+
+    def warm(self) -> None:
+        """
+        Forward the notification that the application is about to be shown to the worker process.
+        """
+        self.forward_hook("warm")
+
+    def forward_hook(self, hook: str) -> None:
+        """
+        Ask the worker process to call a hook of the application, without waiting for it.
+
+        :param hook: The name of the method of the application.
+        """
+        try:
+            self.connection.send(hook)
+        except OSError as e:
+            logger.error(f"[{self.app.__class__.__name__}] Worker process lost: {e}")
+
+    @staticmethod
+    def run_worker(
+        app_class: Type[Application],
+        callbacks: Dict[str, Callable],
+        shared_memory: SharedMemory,
+        connection: Connection,
+        configuration_file: str,
+        file_level: str,
+        console_level: str,
+    ) -> None:
+        """
+        Generate frames in the worker process on request, writing them in the next slot of the ring.
+        The logger, the configuration, the display settings and the application are set up again, as the worker starts from a fresh interpreter.
+
+        :param app_class: Type[Application]: The class of the application.
+        :param callbacks: Dict[str, Callable]: The callbacks given to the application.
+        :param shared_memory: SharedMemory: The shared memory ring of the frames.
+        :param connection: Connection: The worker end of the pipe to the main process.
+        :param configuration_file: str: The path of the configuration file loaded by the main process.
+        :param file_level: str: The log level for file logging.
+        :param console_level: str: The log level for console logging.
+        """
+        import numpy as np
+
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        Logs.create_logger(file_level, console_level)
+        Configuration.load_file(configuration_file)
+        Board.init_display()
+
+        called_callbacks: List[str] = []
+        app = app_class(
+            {
+                **callbacks,
+                **{
+                    name: (lambda name=name: called_callbacks.append(name))
+                    for name in FORWARDED_CALLBACKS
+                },
+            }
+        )
+        frame_size = (Board.led_cols, Board.led_rows)
+        ring = np.ndarray(
+            (ProcessApplication.RING_SLOTS, Board.led_rows, Board.led_cols, 3),
+            dtype=np.uint8,
+            buffer=shared_memory.buf,
+        )
+        # No frame has the sequence 0, so a ready message read late is dropped like a stale frame
+        connection.send((0, None, [], None))
+
+        slot = 0
+        while True:
+            try:
+                request = connection.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+            if isinstance(request, str):
+                try:
+                    getattr(app, request)()
+                except Exception as e:
+                    logger.error(
+                        f"[{app.__class__.__name__}] Error in {request} in worker process: {e}"
+                    )
+                continue
+
+            sequence, tilt_value, input_value, steps, accelerated_steps, events = (
+                request
+            )
+            Board.set_encoder_steps(steps, accelerated_steps)
+            called_callbacks.clear()
+            try:
+                InputBus.dispatch(app, events)
+                frame = app.generate(TiltState(tilt_value), EncoderInput(input_value))
+                if frame.mode != "RGB":
+                    frame = frame.convert("RGB")
+                if frame.size != frame_size:
+                    canvas = Image.new("RGB", frame_size)
+                    canvas.paste(frame, (0, 0))
+                    frame = canvas
+                ring[slot] = np.asarray(frame)
+                connection.send(
+                    (
+                        sequence,
+                        slot,
+                        list(called_callbacks),
+                        app.get_frame_lifetime(),
+                    )
+                )
+                slot = (slot + 1) % ProcessApplication.RING_SLOTS
+            except Exception as e:
+                logger.error(
+                    f"[{app.__class__.__name__}] Error generating frame in worker process: {e}"
+                )
+                connection.send((sequence, None, list(called_callbacks), None))
+
+        del ring
+        shared_memory.close()
+        connection.close()
+
+    def close(self) -> None:
+        """
+        Stop the worker process and release the shared memory ring.
+        """
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=self.RESPONSE_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.connection.close()
+
+        self.last_frame = None
+        try:
+            self.shared_memory.close()
+        except BufferError:
+            logger.debug(
+                f"[{self.app.__class__.__name__}] Frames still reference the shared memory ring."
+            )
+        self.shared_memory.unlink()
+        logger.debug(f"[{self.app.__class__.__name__}] Worker process stopped.")
@@ -11,11 +11,16 @@ class PathTo:
     PYPROJECT_FILE: str = "pyproject.toml"
 
     LOGS_FOLDER: str = "logs"
+    FRAME_STATS_FILE: str = os.path.join(LOGS_FOLDER, "frame_stats.json")
+    RECORDING_FILE: str = os.path.join(LOGS_FOLDER, "frames.rec")
+    GOLDEN_FAILURES_FOLDER: str = os.path.join(LOGS_FOLDER, "golden/")
     RESOURCES_FOLDER: str = "resources"
     GIF_FOLDER: str = os.path.join(RESOURCES_FOLDER, "gif/horizontal/")
     LIFE_PATTERNS_FOLDER: str = os.path.join(RESOURCES_FOLDER, "life_patterns/")
     MAIN_SCREEN_BACKGROUND_FOLDER: str = os.path.join(RESOURCES_FOLDER, "main_screen/")
     FONT_FILE: str = os.path.join(RESOURCES_FOLDER, "fonts/tiny.otf")
+    GOLDEN_FRAMES_FOLDER: str = os.path.join(RESOURCES_FOLDER, "golden/")
+    GOLDEN_CONFIG_FILE: str = os.path.join(GOLDEN_FRAMES_FOLDER, "config.yaml")
     TEMPLATES_FOLDER: str = "../resources/web/templates"
     STATIC_FOLDER: str = "../resources/web/static"
 
@@ -0,0 +1,53 @@
+import time
+
+from loguru import logger
+
+from app_manager import AppManager
+from config import Configuration
+
+
+class Prewarmer:
+    """Warms the previous and next apps of the carousel up while the loop is idle, so a rotation
+    shows their first frame without building them or filling their caches first.
+    """
+
+    PREWARM_PERIOD: float = 1.0
+
+    enabled: bool = False
+    last_prewarm: float = 0
+
+    @classmethod
+    def init(cls) -> None:
+        """
+        Reads whether the neighbour apps are prewarmed, and keeps them from being evicted if so.
+        """
+        cls.enabled = Configuration.get(
+            "System", "Rendering", "prewarm_neighbour_apps", default=False
+        )
+        if not isinstance(cls.enabled, bool):
+            Configuration.critical_exit(
+                "System.Rendering.prewarm_neighbour_apps must be a boolean."
+            )
+        AppManager.keep_neighbour_apps = cls.enabled
+        if cls.enabled:
+            logger.debug("[Prewarmer] Prewarming the neighbour apps.")
+
+    @classmethod
+    def run(cls) -> None:
+        """
+        Warms the neighbour apps up, at most once per PREWARM_PERIOD, the lazy ones being built without being marked as used.
+        No frame is drawn, so the state of the apps is left as is.
+        To be called while the loop is idle, with the rendering stopped.
+        """
+        if not cls.enabled:
+            return
+        now = time.monotonic()
+        if now - cls.last_prewarm < cls.PREWARM_PERIOD:
+            return
+        cls.last_prewarm = now
+
+        for app in AppManager.get_neighbour_apps():
+            try:
+                app.warm()
+            except Exception as e:
+                logger.error(f"[Prewarmer] Error prewarming {app.name}: {e}")
@@ -0,0 +1,109 @@
+import importlib
+import time
+from importlib.metadata import entry_points
+from typing import Dict, Type
+
+from loguru import logger
+
+from models.application import Application
+from models.module import Module
+
+
+class Registry:
+    """Maps the names of the apps and modules in the configuration to the path of their class, imported only when used.
+    Third-party packages register their apps and modules through the carousel.apps and carousel.modules entry point groups,
+    with the name of their section in the configuration, which must be the name of their class.
+    """
+
+    APPS_ENTRY_POINT_GROUP: str = "carousel.apps"
+    MODULES_ENTRY_POINT_GROUP: str = "carousel.modules"
+
+    # In the order of the carousel, followed by the apps registered through entry points
+    apps: Dict[str, str] = {
+        "MainScreen": "apps.main_screen:MainScreen",
+        "GifPlayer": "apps.gif_viewer:GifPlayer",
+        "Pomodoro": "apps.pomodoro:Pomodoro",
+        "GameOfLife": "apps.life:GameOfLife",
+        # "Weather": "apps.weather:WeatherScreen",
+        # "Notion": "apps.notion:NotionScreen",
+        # "Subcount": "apps.subcount:SubcountScreen",
+        # "Spotify": "apps.spotify_player:SpotifyScreen",
+    }
+    modules: Dict[str, str] = {
+        "Notifications": "modules.notification_module:Notifications",
+        # "Weather": "modules.weather_module:WeatherModule",
+        # "Spotify": "modules.spotify_module:SpotifyModule",
+    }
+    # Time spent importing each implementation module, with the packages it imported first
+    import_times: Dict[str, float] = {}
+
+    @classmethod
+    def discover(cls) -> None:
+        """
+        Registers the apps and modules of the installed packages, without importing them.
+        An entry point cannot replace a built-in app or module.
+        """
+        for group, registered in (
+            (cls.APPS_ENTRY_POINT_GROUP, cls.apps),
+            (cls.MODULES_ENTRY_POINT_GROUP, cls.modules),
+        ):
+            for entry_point in entry_points(group=group):
+                if entry_point.name in registered:
+                    logger.warning(
+                        f"[Registry] {entry_point.name} from {group} is already registered, ignored."
+                    )
+                    continue
+                registered[entry_point.name] = entry_point.value
+                logger.debug(
+                    f"[Registry] Registered {entry_point.name} from {group}: {entry_point.value}."
+                )
+
+    @classmethod
+    def get_app_class(cls, app_name: str) -> Type[Application]:
+        """
+        Imports the class of an app.
+
+        :param app_name: The name of the app in the configuration.
+        :return: Type[Application]: The class of the app.
+        """
+        return cls.load_class(cls.apps[app_name])
+
+    @classmethod
+    def get_module_class(cls, module_name: str) -> Type[Module]:
+        """
+        Imports the class of a module.
+
+        :param module_name: The name of the module in the configuration.
+        :return: Type[Module]: The class of the module.
+        """
+        return cls.load_class(cls.modules[module_name])
+
+    @classmethod
+    def load_class(cls, path: str) -> type:
+        """
+        Imports a class from its path, recording the import time of its module the first time.
+
+        :param path: The path of the class, as "package.module:Class".
+        :return: type: The class.
+        """
+        module_name, class_name = path.split(":")
+        start_time = time.perf_counter()
+        module = importlib.import_module(module_name)
+        if module_name not in cls.import_times:
+            cls.import_times[module_name] = time.perf_counter() - start_time
+        return getattr(module, class_name)
+
+    @classmethod
+    def log_import_report(cls) -> None:
+        """
+        Logs the import time of each implementation module imported, slowest first.
+        """
+        for module_name, import_time in sorted(
+            cls.import_times.items(), key=lambda item: item[1], reverse=True
+        ):
+            logger.info(
+                f"[Registry] Imported {module_name} in {import_time * 1000:.0f}ms."
+            )
+        logger.info(
+            f"[Registry] {len(cls.import_times)} modules imported in {sum(cls.import_times.values()) * 1000:.0f}ms."
+        )
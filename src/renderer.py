@@ -0,0 +1,237 @@
+import math
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from PIL import Image
+
+from app_manager import AppManager
+from board import Board
+from config import Configuration
+from custom_frames import CustomFrames
+from enums.service_status import ServiceStatus
+from frame_stats import FrameStats
+from input_bus import InputBus
+from models.application import Application
+from models.input_event import InputEvent
+from prewarmer import Prewarmer
+
+
+class Renderer:
+    """Render stage producing the frames of the current application, optionally ahead of time on a worker thread."""
+
+    RENDER_AHEAD_FRAMES_MAX: int = 8
+    PUT_TIMEOUT: float = 0.1
+    ERROR_FRAME_LIFETIME_MIN: float = 0.5
+    ERROR_FRAME_LIFETIME_MAX: float = 8.0
+
+    render_ahead_frames: int = 0
+    frames_queue: "queue.Queue[Tuple[int, Image.Image, str, Optional[float]]]"
+    generation: int = 0
+    generation_lock: threading.Lock = threading.Lock()
+    worker: Optional[threading.Thread] = None
+    # Set on each invalidation, the worker waits on it while the last frame stays valid
+    invalidated: threading.Event = threading.Event()
+    # Held by the worker while rendering a frame, so suspending waits for the frame in progress
+    render_lock: threading.Lock = threading.Lock()
+    # Cleared while the rendering is suspended, the worker waits on it before each frame
+    active: threading.Event = threading.Event()
+    # Validity of the next error frame, doubled on each consecutive rendering failure
+    error_frame_lifetime: float = ERROR_FRAME_LIFETIME_MIN
+
+    @classmethod
+    def init(cls) -> None:
+        """
+        Initializes the render stage and starts the render worker if render ahead is enabled.
+        """
+        cls.render_ahead_frames = Configuration.get(
+            "System", "Rendering", "render_ahead_frames", default=0
+        )
+        if (
+            not isinstance(cls.render_ahead_frames, int)
+            or cls.render_ahead_frames < 0
+            or cls.render_ahead_frames > cls.RENDER_AHEAD_FRAMES_MAX
+        ):
+            Configuration.critical_exit(
+                f"System.Rendering.render_ahead_frames must be an integer between 0 and {cls.RENDER_AHEAD_FRAMES_MAX}."
+            )
+        Prewarmer.init()
+
+        if cls.render_ahead_frames > 0:
+            cls.start_worker()
+        else:
+            logger.debug("[Renderer] Rendering frames on the main loop.")
+
+    @classmethod
+    def start_worker(cls) -> None:
+        """
+        Starts the render worker filling a queue bounded to the number of frames to render ahead.
+        """
+        cls.frames_queue = queue.Queue(maxsize=cls.render_ahead_frames)
+        cls.active.set()
+        InputBus.listeners.append(lambda event: cls.invalidate())
+        cls.worker = threading.Thread(
+            target=cls.run_worker, name="RenderWorker", daemon=True
+        )
+        cls.worker.start()
+        logger.info(
+            f"[Renderer] Render worker started, rendering {cls.render_ahead_frames} frames ahead."
+        )
+
+    @staticmethod
+    def render_frame(
+        events: List[InputEvent],
+    ) -> Tuple[Image.Image, str, Optional[float]]:
+        """
+        Renders the next frame of the current application with the latest inputs.
+        The input events are delivered to the handlers the application subscribed before its frame is generated.
+        The render time is attributed to the application current when the rendering started.
+
+        :param events: The input events drained from the input bus, some left for the next frames if they must be delivered separately.
+        :return: Tuple[Image.Image, str, Optional[float]]: The rendered frame, the name of the application that rendered it
+        and the monotonic time until which the frame stays valid, None if the frame must be rendered again every frame.
+        """
+        events = Board.apply_input_events(events)
+        current_app: Application = AppManager.get_current_app()
+        start_time = time.perf_counter()
+        InputBus.dispatch(current_app, events)
+        frame: Image.Image = current_app.generate(Board.tilt_state, Board.encoder_input)
+        valid_until: Optional[float] = None
+        frame_lifetime = current_app.get_frame_lifetime()
+        # The inputs left for the next frames are delivered on the next frame
+        if frame_lifetime is not None and not Board.has_pending_events():
+            valid_until = time.monotonic() + frame_lifetime
+        render_time = time.perf_counter() - start_time
+        FrameStats.record(current_app.name, FrameStats.RENDER, render_time)
+        Board.reset_encoder_input_status()
+        return frame, current_app.name, valid_until
+
+    @classmethod
+    def render_frame_or_error(
+        cls, events: List[InputEvent]
+    ) -> Tuple[Image.Image, str, Optional[float]]:
+        """
+        Renders the next frame, or the error frame of the current application if the rendering fails.
+        The error frame stays valid for a delay doubling on each consecutive failure, so a failing application is
+        retried with a backoff, or on the next input, instead of in a loop.
+
+        :param events: The input events drained from the input bus.
+        :return: Tuple[Image.Image, str, Optional[float]]: The rendered frame, the name of the application that rendered it
+        and the monotonic time until which the frame stays valid.
+        """
+        try:
+            result = cls.render_frame(events)
+        except Exception as e:
+            Board.reset_encoder_input_status()
+            app_name = AppManager.get_current_app_name()
+            logger.error(
+                f"[Renderer] Error rendering a frame of {app_name}, retrying in {cls.error_frame_lifetime:.1f}s: {e}"
+            )
+            valid_until = time.monotonic() + cls.error_frame_lifetime
+            cls.error_frame_lifetime = min(
+                cls.error_frame_lifetime * 2, cls.ERROR_FRAME_LIFETIME_MAX
+            )
+            return (
+                CustomFrames.error(ServiceStatus.ERROR_APP_INTERNAL),
+                app_name,
+                valid_until,
+            )
+        cls.error_frame_lifetime = cls.ERROR_FRAME_LIFETIME_MIN
+        return result
+
+    @classmethod
+    def run_worker(cls) -> None:
+        """
+        Renders frames ahead of time until the queue is full. A frame rendered before an
+        invalidation is not queued. After a frame valid for more than a frame period, the
+        next frame is only rendered once the frame expires or an invalidation happens.
+        A failed rendering queues the error frame of the application, so the next one waits for its backoff delay.
+        """
+        while True:
+            cls.active.wait()
+            with cls.render_lock:
+                if not cls.active.is_set():
+                    continue
+                # The input bus invalidates under its lock, so the frame is dropped only if an event came after the drain
+                with InputBus.condition:
+                    generation = cls.generation
+                    cls.invalidated.clear()
+                    events = InputBus.drain()
+                frame, app_name, valid_until = cls.render_frame_or_error(events)
+
+            while generation == cls.generation:
+                try:
+                    cls.frames_queue.put(
+                        (generation, frame, app_name, valid_until),
+                        timeout=cls.PUT_TIMEOUT,
+                    )
+                    break
+                except queue.Full:
+                    continue
+
+            if valid_until is not None:
+                remaining = valid_until - time.monotonic()
+                if remaining > Board.refresh_rate:
+                    cls.invalidated.wait(None if math.isinf(remaining) else remaining)
+
+    @classmethod
+    def suspend(cls) -> None:
+        """
+        Stops the render worker from rendering frames, waiting for the frame in progress, and drops the frames rendered ahead.
+        """
+        cls.active.clear()
+        with cls.render_lock:
+            pass
+        cls.invalidate()
+
+    @classmethod
+    def resume(cls) -> None:
+        """
+        Lets the render worker render frames again.
+        """
+        cls.invalidate()
+        cls.active.set()
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """
+        Prewarms the neighbour apps while the loop is idle, the render worker waiting for the prewarm to end.
+        """
+        with cls.render_lock:
+            if cls.worker is not None and not cls.active.is_set():
+                return
+            Prewarmer.run()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drops the frames rendered ahead, so the next frame reflects the latest inputs.
+        """
+        if cls.worker is None:
+            return
+        with cls.generation_lock:
+            cls.generation += 1
+            cls.invalidated.set()
+            while True:
+                try:
+                    cls.frames_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    @classmethod
+    def next_frame(cls) -> Tuple[Image.Image, str, Optional[float]]:
+        """
+        Returns the next frame to present, popped from the render worker queue or rendered in place.
+
+        :return: Tuple[Image.Image, str, Optional[float]]: The next frame, the name of the application that rendered it
+        and the monotonic time until which the frame stays valid.
+        """
+        if cls.worker is None:
+            return cls.render_frame_or_error(InputBus.drain())
+
+        while True:
+            generation, frame, app_name, valid_until = cls.frames_queue.get()
+            if generation == cls.generation:
+                return frame, app_name, valid_until
@@ -0,0 +1,130 @@
+import argparse
+import sys
+import time
+
+from loguru import logger
+
+from backends.recorder_matrix import FrameRecording
+from board import Board
+from config import Configuration
+from display import Display
+from enums.matrix_backend import MatrixBackend
+from logs import Logs
+from path import PathTo
+
+
+def export_gif(recording: FrameRecording, output_file: str) -> None:
+    """
+    Exports the frames of a recording to an animated GIF, keeping the intervals between frames.
+
+    :param recording: FrameRecording: The recording to export.
+    :param output_file: str: The path of the GIF file to write.
+    """
+    timestamps, frames = [], []
+    for timestamp, frame in recording.frames():
+        timestamps.append(timestamp)
+        frames.append(frame)
+    if not frames:
+        logger.warning("[Replay] The recording is empty, nothing to export.")
+        return
+
+    # The last frame is shown as long as the average interval
+    intervals = [end - start for start, end in zip(timestamps, timestamps[1:])]
+    average_interval = sum(intervals) / len(intervals) if intervals else 0.1
+    durations = [
+        max(1, round(interval * 1000)) for interval in intervals + [average_interval]
+    ]
+    frames[0].save(
+        output_file,
+        save_all=True,
+        append_images=frames[1:],
+        duration=durations,
+        loop=0,
+    )
+    print(f"Exported {len(frames)} frames to {output_file}")
+
+
+def play(
+    recording: FrameRecording, matrix_backend: MatrixBackend, speed: float
+) -> None:
+    """
+    Plays the frames of a recording back on a matrix backend, at the pace they were presented, as they reached the matrix.
+
+    :param recording: FrameRecording: The recording to play.
+    :param matrix_backend: MatrixBackend: The backend to present the frames to.
+    :param speed: float: The playback speed, 1 being real time.
+    """
+    # A replay reads the configuration without creating a generation
+    Configuration.load(create_if_missing=False)
+    Board.init_display()
+    if (Board.led_cols, Board.led_rows) != (recording.width, recording.height):
+        logger.warning(
+            f"[Replay] The recording is {recording.width}x{recording.height}, the matrix is {Board.led_cols}x{Board.led_rows}."
+        )
+    Board.init_matrix(matrix_backend=matrix_backend)
+
+    start_time = time.monotonic()
+    first_timestamp = None
+    for timestamp, frame in recording.frames():
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        delay = start_time + (timestamp - first_timestamp) / speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        # The frames were recorded after the colour correction
+        Display.present(frame, apply_correction=False)
+    Display.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay or export the frames recorded with --record"
+    )
+    parser.add_argument(
+        "--file",
+        default=PathTo.RECORDING_FILE,
+        help=f"Recording file, relative to the project directory (default is {PathTo.RECORDING_FILE})",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--emulator", action="store_true", help="Play back in the emulator"
+    )
+    output.add_argument(
+        "--gif", metavar="OUTPUT_FILE", help="Export the recording to an animated GIF"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="Playback speed (default is 1.0)"
+    )
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be a positive number")
+
+    PathTo.set_base_directory()
+    PathTo.add_library_to_path()
+    Logs.create_logger(file_level="DEBUG", console_level="WARNING")
+
+    try:
+        recording = FrameRecording.open(args.file)
+    except FileNotFoundError:
+        logger.error(f"[Replay] Recording file not found: {args.file}")
+        sys.exit(f"Recording file not found: {args.file}, record one with --record.")
+    try:
+        logger.info(
+            f"[Replay] Opened {args.file}: {min(recording.frames_written, recording.capacity)} frames of {recording.width}x{recording.height}."
+        )
+        if args.gif:
+            export_gif(recording, args.gif)
+        else:
+            play(
+                recording,
+                MatrixBackend.EMULATOR if args.emulator else MatrixBackend.HARDWARE,
+                args.speed,
+            )
+    except KeyboardInterrupt:
+        logger.info("[Replay] Playback stopped by user.")
+    finally:
+        recording.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import math
+import time
+from typing import Optional
+
+from loguru import logger
+
+from input_bus import InputBus
+
+
+class FrameScheduler:
+    """Paces the main loop on absolute frame deadlines taken from a monotonic clock."""
+
+    MAX_CATCH_UP_FRAMES: int = 3
+    IDLE_FRAMES_THRESHOLD: int = 20
+    IDLE_MAX_PERIOD: float = 1.0
+
+    frame_period: float
+    next_deadline: float
+    frame_count: int = 0
+    missed_deadlines: int = 0
+    dropped_frames: int = 0
+    unchanged_frames: int = 0
+    idle_period: float = 0
+    input_sequence: int = 0
+    # Whether the last wait for the frame on screen to expire was cut by an input or had no expiry
+    interrupted_expiry_wait: bool = False
+
+    @classmethod
+    def init(cls, frame_period: float) -> None:
+        """
+        Initializes the scheduler and sets the first deadline one period from now.
+
+        :param frame_period: The target duration of a frame in seconds.
+        """
+        cls.frame_period = frame_period
+        cls.next_deadline = time.monotonic() + frame_period
+        cls.frame_count = 0
+        cls.missed_deadlines = 0
+        cls.dropped_frames = 0
+        cls.unchanged_frames = 0
+        cls.idle_period = 0
+        cls.input_sequence = InputBus.sequence
+        logger.debug(
+            f"[FrameScheduler] Initialized with a frame period of {frame_period}s."
+        )
+
+    @classmethod
+    def restart(cls) -> None:
+        """
+        Restarts the deadlines one period from now, after the loop was paused.
+        """
+        cls.next_deadline = time.monotonic() + cls.frame_period
+        cls.unchanged_frames = 0
+        cls.idle_period = 0
+        cls.input_sequence = InputBus.sequence
+
+    @classmethod
+    def wait_for_input(cls, timeout: float) -> bool:
+        """
+        Sleeps until an input event is published on the input bus or the timeout expires.
+
+        :param timeout: The maximum time to sleep in seconds.
+        :return: bool: True if woken up by an input, False otherwise.
+        """
+        sequence = InputBus.wait(timeout, cls.input_sequence)
+        has_input = sequence != cls.input_sequence
+        cls.input_sequence = sequence
+        return has_input
+
+    @classmethod
+    def is_idle(cls) -> bool:
+        """
+        Checks if the loop backed off because the display is static.
+
+        :returns: True if the loop is idle, False otherwise.
+        """
+        return cls.unchanged_frames >= cls.IDLE_FRAMES_THRESHOLD
+
+    @classmethod
+    def wait_for_next_frame(
+        cls, has_changed: bool = True, valid_until: Optional[float] = None
+    ) -> bool:
+        """
+        Sleeps until the deadline of the next frame, so the time spent rendering is
+        deducted from the sleep. When the deadline is already missed, the next frame
+        starts right away to catch up, and if the loop is more than MAX_CATCH_UP_FRAMES
+        behind, the late frames are dropped and the deadlines realigned on the grid.
+        After IDLE_FRAMES_THRESHOLD identical frames, the loop backs off and waits for
+        an input or an exponentially growing idle period instead. When the frame on
+        screen stays valid past the next deadline, the loop sleeps until it expires.
+        An input event ends the sleep right away, and the deadlines restart from the input.
+
+        :param has_changed: Whether the last frame differed from the one on screen.
+        :param valid_until: The monotonic time until which the frame on screen stays valid, None if it must be rendered again every frame (default is None).
+        :return: bool: True if the deadline of the last frame was missed, False otherwise.
+        """
+        cls.unchanged_frames = 0 if has_changed else cls.unchanged_frames + 1
+        cls.interrupted_expiry_wait = False
+        if valid_until is not None and valid_until > cls.next_deadline:
+            cls.wait_until_expiry(valid_until)
+            return False
+        if cls.is_idle():
+            cls.wait_while_idle()
+            return False
+        cls.idle_period = 0
+
+        now = time.monotonic()
+        remaining = cls.next_deadline - now
+        cls.frame_count += 1
+
+        if remaining > 0:
+            if cls.wait_for_input(remaining):
+                cls.next_deadline = time.monotonic() + cls.frame_period
+            else:
+                cls.next_deadline += cls.frame_period
+            return False
+
+        cls.missed_deadlines += 1
+        late_frames = int(-remaining // cls.frame_period)
+        if late_frames >= cls.MAX_CATCH_UP_FRAMES:
+            cls.dropped_frames += late_frames
+            cls.next_deadline += (late_frames + 1) * cls.frame_period
+            logger.debug(
+                f"[FrameScheduler] {late_frames} frames behind schedule, dropped them."
+            )
+        else:
+            cls.next_deadline += cls.frame_period
+        return True
+
+    @classmethod
+    def wait_until_expiry(cls, valid_until: float) -> None:
+        """
+        Waits for an input or until the frame on screen expires, math.inf waiting for an input only.
+        The deadlines restart from the end of the wait.
+
+        :param valid_until: The monotonic time until which the frame on screen stays valid.
+        """
+        timeout = (
+            None
+            if math.isinf(valid_until)
+            else max(0.0, valid_until - time.monotonic())
+        )
+        woke_on_input = cls.wait_for_input(timeout)
+        cls.interrupted_expiry_wait = timeout is None or woke_on_input
+        cls.frame_count += 1
+        cls.next_deadline = time.monotonic() + cls.frame_period
+
+    @classmethod
+    def wait_while_idle(cls) -> None:
+        """
+        Waits for an input or for the idle period, doubled on every idle frame up to IDLE_MAX_PERIOD.
+        The deadlines restart from the end of the wait.
+        """
+        cls.idle_period = min(
+            cls.IDLE_MAX_PERIOD, max(cls.frame_period, cls.idle_period) * 2
+        )
+        if cls.wait_for_input(cls.idle_period):
+            cls.unchanged_frames = 0
+            logger.debug("[FrameScheduler] Woken up from idle by an input.")
+        cls.frame_count += 1
+        cls.next_deadline = time.monotonic() + cls.frame_period
+
+    @classmethod
+    def log_statistics(cls) -> None:
+        """
+        Logs the number of frames scheduled, missed deadlines and dropped frames.
+        """
+        logger.info(
+            f"[FrameScheduler] {cls.frame_count} frames scheduled, "
+            f"{cls.missed_deadlines} missed deadlines, "
+            f"{cls.dropped_frames} dropped frames."
+        )
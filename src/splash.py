@@ -0,0 +1,98 @@
+import threading
+from typing import Optional
+
+from loguru import logger
+
+from custom_frames import CustomFrames
+from display import Display
+
+
+class Splash:
+    """Boot splash showing the initialization progress on the matrix, from its own thread."""
+
+    FRAME_PERIOD: float = 0.1
+
+    completed: int = 0
+    total: int = 0
+    lock: threading.Lock = threading.Lock()
+    stop_event: threading.Event = threading.Event()
+    thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        Starts the splash thread, showing the loading frame of the current progress.
+        """
+        cls.completed = 0
+        cls.total = 0
+        cls.resume()
+        logger.debug("[Splash] Boot splash started.")
+
+    @classmethod
+    def report_progress(cls, component_name: str, completed: int, total: int) -> None:
+        """
+        Updates the progress of the initialization, from any thread.
+
+        :param component_name: The name of the component initialized.
+        :param completed: The number of components initialized.
+        :param total: The number of components to initialize.
+        """
+        with cls.lock:
+            cls.completed = completed
+            cls.total = total
+        logger.debug(f"[Splash] {component_name} initialized ({completed}/{total}).")
+
+    @classmethod
+    def get_percentage(cls) -> int:
+        """
+        Returns the progress of the initialization.
+
+        :return: int: The percentage of the components initialized, 0 before the first report.
+        """
+        with cls.lock:
+            if cls.total == 0:
+                return 0
+            return cls.completed * 100 // cls.total
+
+    @classmethod
+    def run(cls) -> None:
+        """
+        Presents the loading frame of the current progress every frame period, until stopped.
+        """
+        while True:
+            Display.present(CustomFrames.loading(cls.get_percentage()))
+            if cls.stop_event.wait(cls.FRAME_PERIOD):
+                break
+
+    @classmethod
+    def pause(cls) -> bool:
+        """
+        Stops the splash thread, leaving the last frame on the matrix.
+
+        :return: bool: True if the splash was running, False otherwise.
+        """
+        if cls.thread is None:
+            return False
+        cls.stop_event.set()
+        cls.thread.join()
+        cls.thread = None
+        return True
+
+    @classmethod
+    def resume(cls) -> None:
+        """
+        Starts the splash thread again, showing the current progress.
+        """
+        cls.stop_event.clear()
+        cls.thread = threading.Thread(target=cls.run, name="Splash", daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """
+        Stops the splash thread and clears the matrix.
+        """
+        if not cls.pause():
+            return
+        Display.clear()
+        logger.debug("[Splash] Boot splash stopped.")
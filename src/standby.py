@@ -0,0 +1,61 @@
+import time
+from typing import List
+
+from loguru import logger
+
+from app_manager import AppManager
+from board import Board
+from display import Display
+from enums.encoder_input import EncoderInput
+from enums.input_event_type import InputEventType
+from frame_stats import FrameStats
+from input_bus import InputBus
+from models.input_event import InputEvent
+from renderer import Renderer
+from scheduler import FrameScheduler
+
+
+class Standby:
+    """Power save state of the main loop while the display is off, nothing is rendered until a wake gesture."""
+
+    WAKE_GESTURES: List[EncoderInput] = [EncoderInput.SINGLE_PRESS]
+
+    @classmethod
+    def run(cls) -> None:
+        """
+        Suspends the rendering and the apps, blanks the matrix with a single write and blocks on the input bus until a wake gesture.
+        The inputs received in standby are not delivered to the apps, so the wake gesture does not reach the current app.
+        """
+        logger.info("[Standby] Display off, rendering suspended.")
+        start_time = time.monotonic()
+        Renderer.suspend()
+        AppManager.suspend_apps()
+        Display.clear()
+        FrameStats.reset_tick()
+
+        sequence = InputBus.sequence
+        while True:
+            sequence = InputBus.wait(None, sequence)
+            if cls.has_wake_gesture(InputBus.drain()):
+                break
+
+        Board.is_display_on = True
+        FrameScheduler.restart()
+        AppManager.resume_apps()
+        Renderer.resume()
+        logger.info(
+            f"[Standby] Display on after {time.monotonic() - start_time:.0f}s, rendering resumed."
+        )
+
+    @classmethod
+    def has_wake_gesture(cls, events: List[InputEvent]) -> bool:
+        """
+        Checks if the input events contain a wake gesture.
+
+        :param events: The input events received in standby.
+        :return: bool: True if one of the events is a wake gesture, False otherwise.
+        """
+        return any(
+            event.type is InputEventType.GESTURE and event.value in cls.WAKE_GESTURES
+            for event in events
+        )
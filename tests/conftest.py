@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+from config import Configuration
+from path import PathTo
+
+# The resources are found from the root of the repository, as after PathTo.set_base_directory
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def configuration():
+    """
+    Load the example configuration, read by the apps when built.
+    """
+    Configuration.load_file(PathTo.TEMPLATE_CONFIG_FILE)
+    return Configuration
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-golden",
+        action="store_true",
+        help="Replace the golden frames of the apps instead of comparing them",
+    )
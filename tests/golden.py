@@ -0,0 +1,249 @@
+import os
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import yaml
+from loguru import logger
+from PIL import Image
+
+from app_manager import AppManager
+from board import Board
+from clock import Clock
+from enums.encoder_input import EncoderInput
+from enums.input_event_type import InputEventType
+from enums.tilt_input import TiltState
+from frame_stats import LatencyHistogram
+from input_bus import InputBus
+from models.application import Application
+from models.input_event import InputEvent
+from models.process_application import ProcessApplication
+from path import PathTo
+
+
+class GoldenFrames:
+    """Harness of the golden frame tests, rendering each enabled app with a frozen clock and scripted inputs."""
+
+    FROZEN_TIME: datetime = datetime(2024, 12, 25, 9, 41, 0)
+    RANDOM_SEED: int = 0
+    # Encoder input, tilt state and seconds the clock moves forward before each frame.
+    # The tilt states are the ones of an app with horizontal content, swapped for the apps with vertical content only.
+    SCRIPT: List[Tuple[EncoderInput, TiltState, float]] = [
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 0.0),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 1.0),
+        (EncoderInput.INCREASE_CLOCKWISE, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.DECREASE_COUNTERCLOCKWISE, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.SINGLE_PRESS, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 1.0),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 60.0),
+        (EncoderInput.NOTHING, TiltState.VERTICAL, 0.05),
+        (EncoderInput.SINGLE_PRESS, TiltState.VERTICAL, 1.0),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.SINGLE_PRESS, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.LONG_PRESS, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.INCREASE_CLOCKWISE, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.LONG_PRESS, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.DOUBLE_PRESS, TiltState.HORIZONTAL, 0.05),
+        (EncoderInput.NOTHING, TiltState.HORIZONTAL, 1.0),
+        (EncoderInput.DOUBLE_PRESS, TiltState.HORIZONTAL, 0.05),
+    ]
+    # Encoder steps of the scripted rotations
+    SCRIPTED_STEPS: Dict[EncoderInput, int] = {
+        EncoderInput.INCREASE_CLOCKWISE: 1,
+        EncoderInput.DECREASE_COUNTERCLOCKWISE: -1,
+    }
+    # Maximum difference of a channel for two pixels to be considered the same
+    PIXEL_TOLERANCE: int = 8
+    # Ratio of different pixels over which a frame does not match its golden frame
+    MAX_DIFFERENT_PIXELS_RATIO: float = 0.01
+    # Render time budgets by app name, the frame period of the matrix for the others
+    RENDER_BUDGETS_IN_MS: Dict[str, float] = {
+        "Main Screen": 10.0,
+        "Pomodoro": 10.0,
+        "Game of Life": 15.0,
+        "GIF Player": 40.0,
+    }
+
+    @classmethod
+    def prepare(cls) -> None:
+        """
+        Freezes the clock and seeds the random generators, before the apps are initialized.
+        """
+        Clock.freeze(cls.FROZEN_TIME)
+        random.seed(cls.RANDOM_SEED)
+        np.random.seed(cls.RANDOM_SEED)
+
+    @staticmethod
+    def get_app_names() -> List[str]:
+        """
+        Returns the names of the apps enabled in the golden configuration, read without loading it.
+
+        :return: List[str]: The names of the apps, as shown.
+        """
+        with open(PathTo.GOLDEN_CONFIG_FILE) as file:
+            apps = yaml.safe_load(file)["Apps"]
+        return [app["meta"]["name"] for app in apps.values() if app.get("enabled")]
+
+    @staticmethod
+    def get_app(app_name: str) -> Application:
+        """
+        Returns an enabled application, built, to be rendered in the main process where the clock is frozen.
+
+        :param app_name: The name of the application, as shown.
+        :return: Application: The application.
+        """
+        app = next(app for app in AppManager.enabled_apps if app.name == app_name)
+        app = AppManager.resolve(app)
+        if isinstance(app, ProcessApplication):
+            return app.app
+        return app
+
+    @classmethod
+    def render_script(
+        cls, app: Application
+    ) -> Tuple[List[Image.Image], LatencyHistogram]:
+        """
+        Renders a frame for each step of the script from the frozen time, the tilt states swapped if the app only has vertical content.
+        The first frame, filling the caches of the app, is left out of the render times.
+
+        :param app: The application to render.
+        :return: Tuple[List[Image.Image], LatencyHistogram]: The frames and their render times.
+        """
+        Clock.freeze(cls.FROZEN_TIME)
+        frames = []
+        histogram = LatencyHistogram()
+        previous_tilt_state = None
+        for index, (encoder_input, tilt_state, seconds) in enumerate(cls.SCRIPT):
+            if not app.provides_horizontal_content:
+                tilt_state = (
+                    TiltState.VERTICAL
+                    if tilt_state is TiltState.HORIZONTAL
+                    else TiltState.HORIZONTAL
+                )
+            Clock.advance(seconds)
+            steps = cls.SCRIPTED_STEPS.get(encoder_input, 0)
+            Board.set_encoder_steps(steps, steps)
+            Board.tilt_state = tilt_state
+            events = cls.get_scripted_events(encoder_input, steps)
+            if tilt_state is not previous_tilt_state:
+                events.insert(
+                    0, InputEvent(InputEventType.TILT, tilt_state, time.monotonic())
+                )
+                previous_tilt_state = tilt_state
+            start_time = time.perf_counter()
+            InputBus.dispatch(app, events)
+            frame = app.generate(tilt_state, encoder_input)
+            if index > 0:
+                histogram.record(time.perf_counter() - start_time)
+            frames.append(frame.convert("RGB"))
+        Board.tilt_state = TiltState.HORIZONTAL
+        return frames, histogram
+
+    @staticmethod
+    def get_scripted_events(
+        encoder_input: EncoderInput, steps: int
+    ) -> List[InputEvent]:
+        """
+        Returns the input events of a scripted encoder input, for the apps subscribed to the input bus.
+
+        :param encoder_input: The scripted encoder input.
+        :param steps: The scripted encoder steps.
+        :return: List[InputEvent]: The rotation events of the steps, or the gesture event of the input.
+        """
+        timestamp = time.monotonic()
+        if steps != 0:
+            direction = 1 if steps > 0 else -1
+            return [InputEvent(InputEventType.ROTATION, direction, timestamp)] * abs(
+                steps
+            )
+        if encoder_input is EncoderInput.NOTHING:
+            return []
+        return [InputEvent(InputEventType.GESTURE, encoder_input, timestamp)]
+
+    @staticmethod
+    def get_golden_frame_path(app_name: str, index: int) -> str:
+        """
+        Returns the path of a golden frame.
+
+        :param app_name: The name of the application.
+        :param index: The index of the frame in the script.
+        :return: str: The path of the PNG file.
+        """
+        return os.path.join(PathTo.GOLDEN_FRAMES_FOLDER, app_name, f"{index:03d}.png")
+
+    @classmethod
+    def save_golden_frames(cls, app_name: str, frames: List[Image.Image]) -> None:
+        """
+        Replaces the golden frames of an application.
+
+        :param app_name: The name of the application.
+        :param frames: The frames rendered from the script.
+        """
+        os.makedirs(os.path.join(PathTo.GOLDEN_FRAMES_FOLDER, app_name), exist_ok=True)
+        for index, frame in enumerate(frames):
+            frame.save(cls.get_golden_frame_path(app_name, index))
+        logger.info(f"[GoldenFrames] Saved {len(frames)} golden frames of {app_name}.")
+
+    @classmethod
+    def compare_golden_frames(
+        cls, app_name: str, frames: List[Image.Image]
+    ) -> List[str]:
+        """
+        Compares the frames of an application with its golden frames, saving the mismatching frames next to the logs.
+
+        :param app_name: The name of the application.
+        :param frames: The frames rendered from the script.
+        :return: List[str]: The description of each frame not matching its golden frame.
+        """
+        failures = []
+        for index, frame in enumerate(frames):
+            golden_frame_path = cls.get_golden_frame_path(app_name, index)
+            if not os.path.exists(golden_frame_path):
+                failures.append(
+                    f"frame {index}: no golden frame, run the tests with --update-golden."
+                )
+                continue
+
+            with Image.open(golden_frame_path) as golden_frame:
+                ratio = cls.get_different_pixels_ratio(
+                    frame, golden_frame.convert("RGB")
+                )
+            if ratio > cls.MAX_DIFFERENT_PIXELS_RATIO:
+                failure_folder = os.path.join(PathTo.GOLDEN_FAILURES_FOLDER, app_name)
+                os.makedirs(failure_folder, exist_ok=True)
+                frame.save(os.path.join(failure_folder, f"{index:03d}.png"))
+                failures.append(
+                    f"frame {index}: {ratio:.1%} of the pixels differ, frame saved to {failure_folder}."
+                )
+        return failures
+
+    @classmethod
+    def get_different_pixels_ratio(
+        cls, frame: Image.Image, golden_frame: Image.Image
+    ) -> float:
+        """
+        Returns the ratio of pixels differing from the golden frame by more than the tolerance.
+
+        :param frame: The rendered frame.
+        :param golden_frame: The golden frame.
+        :return: float: The ratio of different pixels, 1 if the sizes differ.
+        """
+        if frame.size != golden_frame.size:
+            return 1.0
+        difference = np.abs(
+            np.asarray(frame, dtype=np.int16) - np.asarray(golden_frame, dtype=np.int16)
+        )
+        return float(np.mean(difference.max(axis=2) > cls.PIXEL_TOLERANCE))
+
+    @classmethod
+    def get_render_budget_in_ms(cls, app_name: str) -> float:
+        """
+        Returns the budget of the 95th percentile of the render times of an application.
+
+        :param app_name: The name of the application.
+        :return: float: The budget in milliseconds, the frame period of the matrix if the app has none.
+        """
+        return cls.RENDER_BUDGETS_IN_MS.get(app_name, Board.refresh_rate * 1000)
@@ -0,0 +1,254 @@
+import threading
+import time
+
+import pytest
+
+from app_manager import AppManager
+from apps.gif_viewer import GifPlayer
+from board import Board
+from enums.encoder_input import EncoderInput
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
+from models.application import Application
+from models.lazy_application import LazyApplication
+from models.module import Module
+
+
+class RecordingApp(Application):
+    """Application recording its lifecycle hooks in a shared log, without reading the configuration."""
+
+    def __init__(self, name: str, log: list):
+        """
+        Create the application, running.
+
+        :param name: str: The name of the application.
+        :param log: list: The log of the hooks, as (name, hook) pairs.
+        """
+        self.name = name
+        self.log = log
+        self.status = ServiceStatus.RUNNING
+
+    def on_enter(self) -> None:
+        self.log.append((self.name, "on_enter"))
+
+    def on_exit(self) -> None:
+        self.log.append((self.name, "on_exit"))
+
+    def suspend(self) -> None:
+        self.log.append((self.name, "suspend"))
+
+    def resume(self) -> None:
+        self.log.append((self.name, "resume"))
+
+
+class RecordingModule(Module):
+    """Module recording its lifecycle hooks in a shared log, without reading the configuration."""
+
+    def __init__(self, name: str, log: list):
+        """
+        Create the module, running.
+
+        :param name: str: The name of the module.
+        :param log: list: The log of the hooks, as (name, hook) pairs.
+        """
+        self.name = name
+        self.log = log
+        self.status = ServiceStatus.RUNNING
+
+    def suspend(self) -> None:
+        self.log.append((self.name, "suspend"))
+
+    def resume(self) -> None:
+        self.log.append((self.name, "resume"))
+
+
+class FailingApp(RecordingApp):
+    """Application whose suspend hook raises."""
+
+    def suspend(self) -> None:
+        raise RuntimeError("suspend failed")
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def carousel(monkeypatch, log):
+    """
+    A carousel of two recording apps and a recording module, in the horizontal tilt state, nothing shown yet.
+    """
+    apps = [RecordingApp("First", log), RecordingApp("Second", log)]
+    monkeypatch.setattr(Board, "tilt_state", TiltState.HORIZONTAL, raising=False)
+    monkeypatch.setattr(AppManager, "enabled_apps", apps, raising=False)
+    monkeypatch.setattr(AppManager, "carousel", apps, raising=False)
+    monkeypatch.setattr(
+        AppManager,
+        "routes",
+        {
+            (index, tilt_state): app
+            for index, app in enumerate(apps)
+            for tilt_state in TiltState
+        },
+    )
+    monkeypatch.setattr(
+        AppManager,
+        "modules",
+        {"Module": RecordingModule("Module", log)},
+        raising=False,
+    )
+    monkeypatch.setattr(AppManager, "current_app_index", 0)
+    monkeypatch.setattr(AppManager, "shown_app", None)
+    monkeypatch.setattr(AppManager, "evictable_apps", [])
+    return apps
+
+
+def get_loader_threads():
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("GifLoader")
+    ]
+
+
+def test_first_show_calls_on_enter(carousel, log):
+    assert AppManager.get_current_app() is carousel[0]
+    assert log == [("First", "on_enter")]
+    AppManager.get_current_app()
+    assert log == [("First", "on_enter")]
+
+
+def test_switch_calls_on_exit_then_on_enter(carousel, log):
+    AppManager.get_current_app()
+    AppManager.current_app_index = 1
+    assert AppManager.get_current_app() is carousel[1]
+    assert log == [
+        ("First", "on_enter"),
+        ("First", "on_exit"),
+        ("Second", "on_enter"),
+    ]
+
+
+def test_display_off_and_on_order(carousel, log):
+    AppManager.get_current_app()
+    AppManager.suspend_apps()
+    AppManager.resume_apps()
+    assert log == [
+        ("First", "on_enter"),
+        ("First", "on_exit"),
+        ("First", "suspend"),
+        ("Second", "suspend"),
+        ("Module", "suspend"),
+        ("Module", "resume"),
+        ("First", "resume"),
+        ("Second", "resume"),
+    ]
+    # The app shown is entered again on its next frame
+    AppManager.get_current_app()
+    assert log[-1] == ("First", "on_enter")
+
+
+def test_hook_error_does_not_stop_the_other_apps(monkeypatch, carousel, log):
+    failing_app = FailingApp("Failing", log)
+    monkeypatch.setattr(AppManager, "enabled_apps", [failing_app] + carousel)
+    AppManager.suspend_apps()
+    assert log == [("First", "suspend"), ("Second", "suspend"), ("Module", "suspend")]
+
+
+def test_lazy_app_not_built_is_not_notified(monkeypatch, configuration, carousel, log):
+    lazy_app = LazyApplication("GifPlayer", {})
+    monkeypatch.setattr(AppManager, "enabled_apps", carousel + [lazy_app])
+    AppManager.suspend_apps()
+    AppManager.resume_apps()
+    assert not lazy_app.is_loaded()
+
+
+def test_eviction_suspends_the_app_before_dropping_it(
+    monkeypatch, configuration, carousel, log
+):
+    lazy_app = LazyApplication("GifPlayer", {})
+    lazy_app.app = RecordingApp("Lazy", log)
+    lazy_app.last_used = time.monotonic() - lazy_app.idle_eviction_in_seconds
+    monkeypatch.setattr(AppManager, "evictable_apps", [lazy_app])
+    monkeypatch.setattr(AppManager, "last_eviction_check", 0)
+    AppManager.get_current_app()
+    assert not lazy_app.is_loaded()
+    # The app was hidden, so it already got on_exit
+    assert log == [("Lazy", "suspend"), ("First", "on_enter")]
+
+
+@pytest.fixture
+def gif_player(monkeypatch, configuration):
+    monkeypatch.setattr(Board, "led_cols", 64, raising=False)
+    monkeypatch.setattr(Board, "led_rows", 32, raising=False)
+    gif_player = GifPlayer({})
+    yield gif_player
+    gif_player.suspend()
+
+
+def test_gif_player_suspend_frees_the_cache_and_the_loader(gif_player):
+    gif_player.generate(TiltState.HORIZONTAL, EncoderInput.NOTHING)
+    assert gif_player.cache.used > 0
+    assert get_loader_threads()
+
+    gif_player.suspend()
+    assert gif_player.cache.used == 0
+    assert gif_player.animation is None
+    assert not get_loader_threads()
+
+
+def test_gif_player_plays_again_after_resume(gif_player):
+    gif_player.generate(TiltState.HORIZONTAL, EncoderInput.NOTHING)
+    gif_player.suspend()
+    gif_player.resume()
+    frame = gif_player.generate(TiltState.HORIZONTAL, EncoderInput.NOTHING)
+    assert gif_player.status == ServiceStatus.RUNNING
+    assert frame.size == (64, 32)
+    assert gif_player.animation is not None
+
+
+def test_lazy_gif_player_eviction_stops_the_loader(monkeypatch, configuration):
+    monkeypatch.setattr(Board, "led_cols", 64, raising=False)
+    monkeypatch.setattr(Board, "led_rows", 32, raising=False)
+    lazy_app = LazyApplication("GifPlayer", {})
+    lazy_app.generate(TiltState.HORIZONTAL, EncoderInput.NOTHING)
+    assert get_loader_threads()
+    lazy_app.unload()
+    assert not lazy_app.is_loaded()
+    assert not get_loader_threads()
+
+
+def test_lazy_gif_player_warm_decodes_without_playing(monkeypatch, configuration):
+    monkeypatch.setattr(Board, "led_cols", 64, raising=False)
+    monkeypatch.setattr(Board, "led_rows", 32, raising=False)
+    lazy_app = LazyApplication("GifPlayer", {})
+    lazy_app.warm()
+    gif_player = lazy_app.app
+    path = gif_player.get_path(gif_player.current_animation_index)
+    gif_player.loads[path].result(timeout=5.0)
+    assert path in gif_player.cache
+    assert gif_player.animation is None
+    assert lazy_app.last_used == 0
+    lazy_app.unload()
+
+
+def test_eviction_keeps_the_prewarmed_neighbours(
+    monkeypatch, configuration, carousel, log
+):
+    lazy_app = LazyApplication("GifPlayer", {})
+    lazy_app.app = RecordingApp("Lazy", log)
+    carousel.append(lazy_app)
+    monkeypatch.setattr(
+        AppManager, "routes", {**AppManager.routes, (2, TiltState.HORIZONTAL): lazy_app}
+    )
+    monkeypatch.setattr(AppManager, "evictable_apps", [lazy_app])
+    monkeypatch.setattr(AppManager, "keep_neighbour_apps", True)
+    monkeypatch.setattr(AppManager, "last_eviction_check", 0)
+    AppManager.get_current_app()
+    assert lazy_app.is_loaded()
+
+    monkeypatch.setattr(AppManager, "keep_neighbour_apps", False)
+    monkeypatch.setattr(AppManager, "last_eviction_check", 0)
+    AppManager.get_current_app()
+    assert not lazy_app.is_loaded()
@@ -0,0 +1,164 @@
+import queue
+import time
+
+import pytest
+from gpiozero import Button
+from gpiozero.pins.mock import MockFactory
+
+from enums.encoder_input import EncoderInput
+from gesture_recognizer import GestureRecognizer
+
+HOLD_TIME = 0.3
+MULTI_PRESS_TIME = 0.1
+# Time left to the timers of the recognizer to fire, in seconds
+TIMEOUT = 2.0
+
+
+class ButtonHarness:
+    """Encoder button on a mock pin wired to a gesture recognizer like the board does, recording the gestures."""
+
+    def __init__(self):
+        """
+        Create the button on a mock pin, released.
+        """
+        self.gestures: queue.Queue = queue.Queue()
+        self.recognizer = GestureRecognizer(
+            self.gestures.put, hold_time=HOLD_TIME, multi_press_time=MULTI_PRESS_TIME
+        )
+        self.factory = MockFactory()
+        self.button = Button(4, pull_up=True, pin_factory=self.factory)
+        self.button.when_pressed = lambda button: self.recognizer.press()
+        self.button.when_released = lambda button: self.recognizer.release()
+
+    def press(self) -> None:
+        """
+        Drive the press edge, the button pulling the pin low.
+        """
+        self.button.pin.drive_low()
+
+    def release(self) -> None:
+        """
+        Drive the release edge.
+        """
+        self.button.pin.drive_high()
+
+    def click(self) -> None:
+        """
+        Press and release the button right away.
+        """
+        self.press()
+        self.release()
+
+    def next_gesture(self, timeout: float = TIMEOUT) -> EncoderInput:
+        """
+        Wait for the next recognized gesture.
+
+        :param timeout: float: The maximum time to wait, in seconds.
+        :return: EncoderInput: The gesture.
+        """
+        return self.gestures.get(timeout=timeout)
+
+    def assert_no_gesture(self, duration: float) -> None:
+        """
+        Check that no gesture is recognized for a while.
+
+        :param duration: float: The time to wait, in seconds.
+        """
+        with pytest.raises(queue.Empty):
+            self.gestures.get(timeout=duration)
+
+    def close(self) -> None:
+        """
+        Cancel the gesture in progress and release the mock pin.
+        """
+        self.recognizer.reset()
+        self.button.close()
+        self.factory.close()
+
+
+@pytest.fixture
+def harness():
+    harness = ButtonHarness()
+    yield harness
+    harness.close()
+
+
+def test_single_press(harness):
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+
+
+def test_single_press_waits_for_the_multi_press_window(harness):
+    start = time.monotonic()
+    harness.click()
+    harness.assert_no_gesture(MULTI_PRESS_TIME / 2)
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+    assert time.monotonic() - start >= MULTI_PRESS_TIME
+
+
+def test_double_press(harness):
+    harness.click()
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.DOUBLE_PRESS
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+
+
+def test_triple_press_is_recognized_on_the_third_release(harness):
+    harness.click()
+    harness.click()
+    harness.click()
+    # The third press is the last one, so the gesture does not wait for the multi-press window
+    assert harness.next_gesture(MULTI_PRESS_TIME / 2) is EncoderInput.TRIPLE_PRESS
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+
+
+def test_presses_apart_from_the_multi_press_window_are_single_presses(harness):
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+
+
+def test_long_press_is_recognized_while_held(harness):
+    start = time.monotonic()
+    harness.press()
+    assert harness.next_gesture() is EncoderInput.LONG_PRESS
+    assert time.monotonic() - start >= HOLD_TIME
+    harness.release()
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+
+
+def test_press_shorter_than_the_hold_time_is_not_a_long_press(harness):
+    harness.press()
+    time.sleep(HOLD_TIME / 3)
+    harness.release()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+    harness.assert_no_gesture(HOLD_TIME)
+
+
+def test_long_press_after_a_press_ends_the_sequence(harness):
+    harness.click()
+    harness.press()
+    assert harness.next_gesture() is EncoderInput.LONG_PRESS
+    harness.release()
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
+
+
+def test_reset_cancels_the_press_in_progress(harness):
+    harness.press()
+    harness.recognizer.reset()
+    harness.assert_no_gesture(HOLD_TIME * 2)
+    # The release of the cancelled press is ignored
+    harness.release()
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+
+
+def test_reset_cancels_the_pending_presses(harness):
+    harness.click()
+    harness.click()
+    harness.recognizer.reset()
+    harness.assert_no_gesture(MULTI_PRESS_TIME * 3)
+    harness.click()
+    assert harness.next_gesture() is EncoderInput.SINGLE_PRESS
@@ -0,0 +1,37 @@
+import pytest
+
+from app_manager import AppManager
+from board import Board
+from clock import Clock
+from config import Configuration
+from enums.matrix_backend import MatrixBackend
+from golden import GoldenFrames
+from path import PathTo
+
+
+@pytest.fixture(scope="module")
+def golden_apps():
+    """
+    The apps built from the golden configuration, headlessly, with the clock frozen and the random generators seeded.
+    """
+    Configuration.load_file(PathTo.GOLDEN_CONFIG_FILE)
+    Board.init_system(matrix_backend=MatrixBackend.NULL, use_mock_gpio=True)
+    GoldenFrames.prepare()
+    AppManager.init_apps()
+    yield
+    # The background threads of the apps, like the GIF loaders, do not outlive the tests
+    AppManager.suspend_apps()
+    AppManager.stop_apps()
+    Clock.unfreeze()
+
+
+@pytest.mark.parametrize("app_name", GoldenFrames.get_app_names())
+def test_golden_frames(request, golden_apps, app_name):
+    frames, histogram = GoldenFrames.render_script(GoldenFrames.get_app(app_name))
+    if request.config.getoption("--update-golden"):
+        GoldenFrames.save_golden_frames(app_name, frames)
+        return
+
+    assert GoldenFrames.compare_golden_frames(app_name, frames) == []
+    p95_in_ms = histogram.percentile(95) * 1000
+    assert p95_in_ms <= GoldenFrames.get_render_budget_in_ms(app_name)
@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from app_manager import AppManager
+from board import Board
+from custom_frames import CustomFrames
+from enums.service_status import ServiceStatus
+from enums.tilt_input import TiltState
+from input_bus import InputBus
+from renderer import Renderer
+
+
+class FailingApp:
+    """Stand-in of a lazy application whose constructor raises."""
+
+    name = "Failing"
+
+
+@pytest.fixture
+def failing_app(monkeypatch):
+    """
+    A carousel of one application failing to render, the error frames prebuilt.
+    """
+    CustomFrames.init(32, 64)
+    app = FailingApp()
+    monkeypatch.setattr(Board, "tilt_state", TiltState.HORIZONTAL, raising=False)
+    monkeypatch.setattr(AppManager, "current_app_index", 0)
+    monkeypatch.setattr(
+        AppManager, "routes", {(0, tilt_state): app for tilt_state in TiltState}
+    )
+
+    def render_frame(events):
+        raise RuntimeError("constructor failed")
+
+    monkeypatch.setattr(Renderer, "render_frame", render_frame)
+    monkeypatch.setattr(
+        Renderer, "error_frame_lifetime", Renderer.ERROR_FRAME_LIFETIME_MIN
+    )
+    return app
+
+
+def test_failed_render_returns_the_error_frame(failing_app):
+    start = time.monotonic()
+    frame, app_name, valid_until = Renderer.render_frame_or_error([])
+    assert frame is CustomFrames.error(ServiceStatus.ERROR_APP_INTERNAL)
+    assert app_name == failing_app.name
+    assert valid_until >= start + Renderer.ERROR_FRAME_LIFETIME_MIN
+
+
+def test_failed_renders_back_off(failing_app):
+    lifetimes = []
+    for _ in range(6):
+        start = time.monotonic()
+        _, _, valid_until = Renderer.render_frame_or_error([])
+        lifetimes.append(valid_until - start)
+    assert lifetimes[1] > lifetimes[0]
+    assert lifetimes[2] > lifetimes[1]
+    assert max(lifetimes) <= Renderer.ERROR_FRAME_LIFETIME_MAX + 0.1
+
+
+def test_successful_render_resets_the_backoff(monkeypatch, failing_app):
+    Renderer.render_frame_or_error([])
+    Renderer.render_frame_or_error([])
+    monkeypatch.setattr(Renderer, "render_frame", lambda events: (None, "App", None))
+    assert Renderer.render_frame_or_error([]) == (None, "App", None)
+    assert Renderer.error_frame_lifetime == Renderer.ERROR_FRAME_LIFETIME_MIN
+
+
+def test_worker_queues_the_error_frame(monkeypatch, failing_app):
+    monkeypatch.setattr(Renderer, "render_ahead_frames", 1)
+    monkeypatch.setattr(Board, "refresh_rate", 0.05, raising=False)
+    monkeypatch.setattr(InputBus, "listeners", [])
+    monkeypatch.setattr(Renderer, "worker", None)
+    Renderer.start_worker()
+    frames = []
+    reader = threading.Thread(
+        target=lambda: frames.append(Renderer.next_frame()), daemon=True
+    )
+    reader.start()
+    reader.join(timeout=2.0)
+    Renderer.suspend()
+    assert frames, "the main loop waited for a frame forever"
+    frame, app_name, valid_until = frames[0]
+    assert frame is CustomFrames.error(ServiceStatus.ERROR_APP_INTERNAL)
+    assert app_name == failing_app.name
+    assert valid_until is not None
@@ -0,0 +1,54 @@
+from PIL import Image
+
+from backends.recorder_matrix import FrameRecording, RecorderMatrix
+from color_correction import ColorCorrection
+from display import Display
+
+
+class FakeCanvas:
+    """Canvas keeping the image drawn on it."""
+
+    def __init__(self):
+        self.image = None
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        self.image = image.copy()
+
+    def Clear(self):
+        self.image = None
+
+
+class FakeMatrix:
+    """Matrix keeping the image swapped on screen."""
+
+    def __init__(self):
+        self.on_screen = None
+
+    def CreateFrameCanvas(self):
+        return FakeCanvas()
+
+    def SwapOnVSync(self, canvas, framerate_fraction=1):
+        self.on_screen = canvas.image
+        return FakeCanvas()
+
+
+def test_replay_shows_the_recorded_frames_as_they_reached_the_matrix(
+    monkeypatch, tmp_path
+):
+    # Halves every channel, like a brightness of 50 applied to the frames
+    monkeypatch.setattr(
+        ColorCorrection, "lookup_table", [level // 2 for level in range(256)] * 3
+    )
+    frame = Image.new("RGB", (4, 2), (200, 100, 50))
+
+    recording = FrameRecording.create(str(tmp_path / "frames.bin"), 4, 2, 8)
+    Display.init(RecorderMatrix(FakeMatrix(), recording))
+    Display.present(frame)
+    ((_, recorded_frame),) = list(recording.frames())
+    recording.close()
+    assert recorded_frame.getpixel((0, 0)) == (100, 50, 25)
+
+    matrix = FakeMatrix()
+    Display.init(matrix)
+    Display.present(recorded_frame, apply_correction=False)
+    assert matrix.on_screen.getpixel((0, 0)) == (100, 50, 25)
@@ -0,0 +1,42 @@
+import threading
+import time
+
+import pytest
+
+from enums.input_event_type import InputEventType
+from input_bus import InputBus
+from scheduler import FrameScheduler
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """
+    A scheduler at 20 frames per second, the input bus empty and without listeners.
+    """
+    monkeypatch.setattr(InputBus, "listeners", [])
+    FrameScheduler.init(0.05)
+    yield FrameScheduler
+    InputBus.pending_events.clear()
+
+
+def test_wait_run_to_the_expiry_is_not_interrupted(scheduler):
+    scheduler.wait_for_next_frame(True, time.monotonic() + 0.2)
+    assert not scheduler.interrupted_expiry_wait
+
+
+def test_wait_cut_by_an_input_is_interrupted(scheduler):
+    timer = threading.Timer(
+        0.05, InputBus.publish, (InputEventType.REFRESH, "Main Screen")
+    )
+    timer.start()
+    start = time.monotonic()
+    scheduler.wait_for_next_frame(True, start + 2.0)
+    timer.join()
+    assert time.monotonic() - start < 1.0
+    assert scheduler.interrupted_expiry_wait
+
+
+def test_next_frame_clears_the_interruption(scheduler):
+    scheduler.interrupted_expiry_wait = True
+    scheduler.wait_for_next_frame(True, None)
+    assert not scheduler.interrupted_expiry_wait